@@ -3,7 +3,7 @@ import asyncio
 import json
 import os
 import signal
-from datetime import datetime
+import time
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 
 from Oracle.events import EventBus
@@ -37,14 +37,15 @@ async def ws_endpoint(ws: WebSocket, event_bus: EventBus = Depends(get_event_bus
     - {"command": "hotkey", "key": "<key_name>"} - Trigger a hotkey event
     """
     await ws.accept()
+    client_info = str(ws.client)
 
-    await event_bus.publish(WebSocketEvent(
-        timestamp=datetime.now(),
+    event_bus.publish_nowait(WebSocketEvent(
+        timestamp=time.time_ns(),
         status=WebSocketStatus.CONNECTED,
         websocket=ws,
-        client_info=str(ws.client)
+        client_info=client_info
     ))
-    logger.info(f"WS connected: {ws.client}")
+    logger.info(f"WS connected: {client_info}")
 
     try:
         while True:
@@ -57,13 +58,13 @@ async def ws_endpoint(ws: WebSocket, event_bus: EventBus = Depends(get_event_bus
                 if msg_type == "overlay_bounds_update":
                     bounds = msg.get("bounds", [])
                     await event_bus.publish(OverlayBoundsUpdateEvent(
-                        bounds=bounds, timestamp=datetime.now()
+                        bounds=bounds, timestamp=time.time_ns()
                     ))
                 elif command == "hotkey":
                     key = msg.get("key", "")
                     logger.info(f"WS hotkey command received: key={key}")
                     await event_bus.publish(HotkeyPressedEvent(
-                        key=key, timestamp=datetime.now()
+                        key=key, timestamp=time.time_ns()
                     ))
                 elif command == "heartbeat" or msg_type == "heartbeat":
                     # Relay heartbeat from external components (e.g. hotkey) to all UI clients
@@ -72,10 +73,10 @@ async def ws_endpoint(ws: WebSocket, event_bus: EventBus = Depends(get_event_bus
                         await ws_service._broadcast_to_clients(msg)
                 elif command == "hover_enter":
                     logger.info("WS hover_enter command received")
-                    await event_bus.publish(HoverEnterEvent(timestamp=datetime.now()))
+                    await event_bus.publish(HoverEnterEvent(timestamp=time.time_ns()))
                 elif command == "hover_leave":
                     logger.info("WS hover_leave command received")
-                    await event_bus.publish(HoverLeaveEvent(timestamp=datetime.now()))
+                    await event_bus.publish(HoverLeaveEvent(timestamp=time.time_ns()))
                 elif command == "shutdown":
                     logger.info("WS shutdown command received, initiating graceful shutdown...")
                     try:
@@ -88,10 +89,9 @@ async def ws_endpoint(ws: WebSocket, event_bus: EventBus = Depends(get_event_bus
             except json.JSONDecodeError:
                 pass
     except WebSocketDisconnect:
-        await event_bus.publish(WebSocketEvent(
-            timestamp=datetime.now(),
+        event_bus.publish_nowait(WebSocketEvent(
+            timestamp=time.time_ns(),
             status=WebSocketStatus.DISCONNECTED,
-            websocket=ws,
-            client_info=str(ws.client)
+            client_info=client_info
         ))
-        logger.info("WS disconnected")
+        logger.info(f"WS disconnected: {client_info}")
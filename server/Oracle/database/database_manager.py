@@ -3,6 +3,8 @@ Database Manager - Async Singleton for Tortoise ORM.
 """
 from typing import Optional
 from tortoise import Tortoise
+from tortoise.backends.base.client import BaseTransactionWrapper
+from tortoise.connection import connections
 
 from Oracle.tooling.logger import Logger
 from Oracle.tooling.singleton import SingletonMixin
@@ -12,6 +14,34 @@ from Oracle.tooling.paths import get_base_path
 
 logger = Logger("DatabaseManager")
 
+# Connection names: writes stay on the default connection, reads go through a
+# second WAL connection so they don't queue behind the writer's aiosqlite thread.
+# The reader is query_only and sees committed data only (a WAL snapshot per
+# statement), never a transaction still open on the writer.
+WRITER_CONNECTION = "default"
+READER_CONNECTION = "reader"
+
+# Columns added to existing tables after their first release. generate_schemas()
+# only creates missing tables, so these are added to older databases on startup.
+ADDED_COLUMNS = {
+    "price_db_revisions": {"content_hash": "VARCHAR(64)"},
+}
+
+
+class ReadWriteRouter:
+    """Tortoise router sending reads to the reader connection and writes to the writer."""
+
+    def db_for_read(self, model: type) -> str:
+        # Inside in_transaction(WRITER_CONNECTION) the writer resolves to the
+        # transaction: read there too, so the transaction sees its own writes and a
+        # read-modify-write stays on one connection
+        if isinstance(connections.get(WRITER_CONNECTION), BaseTransactionWrapper):
+            return WRITER_CONNECTION
+        return READER_CONNECTION
+
+    def db_for_write(self, model: type) -> str:
+        return WRITER_CONNECTION
+
 
 class DatabaseManager(SingletonMixin):
     """Async singleton manager for database connections."""
@@ -35,11 +65,9 @@ class DatabaseManager(SingletonMixin):
         logger.info(f"💾 Initializing database at {self.db_path}")
         
         try:
-            await Tortoise.init(
-                db_url=f"sqlite://{self.db_path}",
-                modules={"models": ["Oracle.database.models"]}
-            )
+            await Tortoise.init(config=self._build_config())
             await Tortoise.generate_schemas()
+            await self._add_missing_columns()
             
             self._initialized = True
             logger.info(f"✅ Database initialized at {self.db_path}")
@@ -53,6 +81,39 @@ class DatabaseManager(SingletonMixin):
                 logger.error(f"❌ Failed to initialize database: {e}")
                 raise
     
+    async def _add_missing_columns(self) -> None:
+        """Add ADDED_COLUMNS that an older database file does not have yet."""
+        connection = Tortoise.get_connection(WRITER_CONNECTION)
+        for table, columns in ADDED_COLUMNS.items():
+            _, rows = await connection.execute_query(f"PRAGMA table_info({table})")
+            existing = {row["name"] for row in rows}
+            for column, sql_type in columns.items():
+                if column not in existing:
+                    await connection.execute_script(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}")
+                    logger.info(f"💾 Added column {table}.{column}")
+    
+    def _build_config(self) -> dict:
+        """Build the Tortoise config with separate writer/reader SQLite connections."""
+        def sqlite_connection(**pragmas: str) -> dict:
+            return {
+                "engine": "tortoise.backends.sqlite",
+                "credentials": {"file_path": self.db_path, "journal_mode": "WAL", **pragmas},
+            }
+
+        return {
+            "connections": {
+                WRITER_CONNECTION: sqlite_connection(),
+                READER_CONNECTION: sqlite_connection(query_only="ON"),
+            },
+            "apps": {
+                "models": {
+                    "models": ["Oracle.database.models"],
+                    "default_connection": WRITER_CONNECTION,
+                }
+            },
+            "routers": [ReadWriteRouter],
+        }
+    
     async def close(self) -> None:
         """Close all database connections."""
         if not self._initialized:
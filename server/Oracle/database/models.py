@@ -220,6 +220,8 @@ class PriceDataBaseRevision(Model):
     timestamp = fields.DatetimeField(auto_now_add=True)
     source = fields.CharEnumField(enum_type=PriceSource, max_length=10)
     item_count = fields.IntField(default=0)
+    # Hash of the local price_table.json contents (LOCAL revisions only)
+    content_hash = fields.CharField(max_length=64, null=True)
     
     class Meta:
         table = "price_db_revisions"
@@ -1,6 +1,6 @@
 """Oracle Events - Event bus and event types."""
 
-from Oracle.events.base_event import Event
+from Oracle.events.base_event import Event, EventEnum
 from Oracle.events.event_bus import EventBus, Subscriber
 
-__all__ = ['Event', 'EventBus', 'Subscriber']
+__all__ = ['Event', 'EventBus', 'EventEnum', 'Subscriber']
@@ -1,28 +1,58 @@
 """Base event class for all Oracle events."""
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import TypeVar, Generic
+from functools import lru_cache
+from typing import Tuple, TypeVar, Generic
 
 
 EventTypeT = TypeVar('EventTypeT', bound=Enum)
 
 
-@dataclass(kw_only=True)
+class EventEnum(str, Enum):
+    """Base for string-valued event enums; ``str(member)`` is its value.
+    
+    Uses ``str.__str__`` directly instead of a Python-level ``__str__``
+    returning ``self.value``, so the conversion in ``to_dict`` stays in C.
+    """
+    __str__ = str.__str__
+
+
+@lru_cache(maxsize=None)
+def _public_field_names(cls: type) -> Tuple[str, ...]:
+    """Public dataclass field names of an event class (events are slotted, no __dict__)."""
+    return tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+
+
+@dataclass(kw_only=True, slots=True)
 class Event(Generic[EventTypeT]):
-    """Base class for all events with generic event type."""
-    timestamp: datetime
+    """Base class for all events with generic event type.
+    
+    ``timestamp`` is either a datetime or epoch nanoseconds from ``time.time_ns()``
+    (cheaper for high-rate producers). Anything that formats it or does datetime
+    arithmetic must go through ``timestamp_dt``, which always returns a datetime.
+    """
+    timestamp: datetime | int
     type: EventTypeT
     
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Event timestamp as a datetime, converted on demand from epoch nanoseconds."""
+        if isinstance(self.timestamp, int):
+            return datetime.fromtimestamp(self.timestamp / 1_000_000_000)
+        return self.timestamp
+    
     def to_dict(self) -> dict:
         """Convert event to dictionary representation."""
-        return {
+        data = {
             k: str(v) if isinstance(v, Enum) else v
-            for k, v in self.__dict__.items()
-            if not k.startswith('_')
+            for k, v in ((k, getattr(self, k)) for k in _public_field_names(type(self)))
         }
+        if isinstance(self.timestamp, int):
+            data['timestamp'] = self.timestamp_dt
+        return data
 
     def __repr__(self) -> str:
         """String representation of the event."""
@@ -33,4 +63,4 @@ class Event(Generic[EventTypeT]):
         return f"{self.__class__.__name__}({fields})"
 
 
-__all__ = ['Event', 'EventTypeT']
+__all__ = ['Event', 'EventEnum', 'EventTypeT']
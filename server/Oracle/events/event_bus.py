@@ -1,11 +1,12 @@
 # Oracle/events/event_bus.py
 import asyncio
-from typing import Callable, Awaitable, List, Dict, TypeAlias, Any, TypeVar
-from collections import defaultdict
+import threading
+from types import MappingProxyType
+from typing import Callable, Awaitable, Dict, Mapping, Optional, Tuple, TypeAlias, Any, TypeVar
 from enum import Enum
 
 from Oracle.tooling.singleton import SingletonMixin
-from Oracle.tooling.logger import Logger
+from Oracle.tooling.logger import Logger, LogLevel
 from Oracle.events.base_event import Event
 
 logger = Logger("EventBus")
@@ -14,11 +15,31 @@ EventT = TypeVar('EventT', bound=Event[Any])
 
 Subscriber: TypeAlias = Callable[[Event[Any]], Awaitable[None]]
 
+# Shared result for event types nobody subscribed to (lookups never insert keys)
+_EMPTY: Tuple[Subscriber, ...] = ()
+
+def _subscriber_key(event_type: Enum) -> Enum | str:
+    """Dict key for an event type's subscribers.
+    
+    String-valued members (EventEnum) are stored as their plain value: parser
+    events carry that very string as their type, so their lookups match by
+    identity instead of comparing strings. The member hashes and compares equal
+    to it, so events typed with the member find the same entry.
+    """
+    return event_type.value if isinstance(event_type, str) else event_type
+
+
 class EventBus(SingletonMixin):
     def __init__(self):
-        # Single subscriber dict for both event types
-        self._subscribers: Dict[Enum, List[Subscriber]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Single subscriber dict for both event types. Writers replace one key's
+        # tuple under the lock; publish reads the read-only view without locking.
+        self._raw: Dict[Enum | str, Tuple[Subscriber, ...]] = {}
+        self._subscribers: Mapping[Enum | str, Tuple[Subscriber, ...]] = MappingProxyType(self._raw)
+        self._lock = threading.Lock()
+        # Events queued by publish_nowait() with the subscriber tuple read at that
+        # time, drained by a single pump task
+        self._queue: asyncio.Queue[Tuple[Event[Any], Tuple[Subscriber, ...]]] = asyncio.Queue()
+        self._pump_task: Optional[asyncio.Task[None]] = None
 
     async def initialize(self):
         """Async initialization if needed."""
@@ -30,8 +51,10 @@ class EventBus(SingletonMixin):
         event_type: Enum
     ) -> None:
         """Subscribe a callback to a specific event type."""
-        async with self._lock:
-            self._subscribers[event_type].append(callback)  # type: ignore
+        key = _subscriber_key(event_type)
+        with self._lock:
+            current = self._raw.get(key, _EMPTY)
+            self._raw[key] = current + (callback,)  # type: ignore
         # Get class name if it's a bound method
         class_name = callback.__self__.__class__.__name__ if hasattr(callback, '__self__') else ''
         method_name = f"{class_name}.{callback.__name__}" if class_name else callback.__name__
@@ -43,9 +66,16 @@ class EventBus(SingletonMixin):
         event_type: Enum
     ) -> None:
         """Unsubscribe a callback from a specific event type."""
-        async with self._lock:
-            if event_type in self._subscribers and callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback) # type: ignore
+        key = _subscriber_key(event_type)
+        with self._lock:
+            current = self._raw.get(key, _EMPTY)
+            if callback in current:
+                index = current.index(callback)
+                remaining = current[:index] + current[index + 1:]
+                if remaining:
+                    self._raw[key] = remaining
+                else:
+                    del self._raw[key]
                 # Get class name if it's a bound method
                 class_name = callback.__self__.__class__.__name__ if hasattr(callback, '__self__') else ''
                 method_name = f"{class_name}.{callback.__name__}" if class_name else callback.__name__
@@ -53,28 +83,70 @@ class EventBus(SingletonMixin):
 
     async def publish(self, event: Event[Any]):
         """Publish an event to all subscribers of its type in parallel."""
-        async with self._lock:
-            subscribers = list(self._subscribers.get(event.type, []))
+        subscribers = self._subscribers.get(event.type, _EMPTY)
         
         if not subscribers:
             return
         
-        logger.debug(f"📨 Publishing {event.type} to {len(subscribers)} subscriber(s)")
+        # Per-event trace only when EventBus logs at DEBUG: every Logger call formats
+        # a timestamp and schedules a file write task, which costs more than the event
+        if logger.level <= LogLevel.DEBUG:
+            logger.debug(f"📨 Publishing {event.type} to {len(subscribers)} subscriber(s)")
+
+        # Common case: one subscriber, nothing to run in parallel, so skip gather's tasks
+        if len(subscribers) == 1:
+            await self._call_subscriber(subscribers[0], event)
+            return
+
+        # Run all subscribers in parallel. _call_subscriber never raises, so one
+        # failing subscriber cannot affect the others.
+        await asyncio.gather(*[self._call_subscriber(sub, event) for sub in subscribers], return_exceptions=True)
+
+    def publish_nowait(self, event: Event[Any]) -> None:
+        """Hand the event to the pump task and return immediately.
+        
+        Unlike publish(), nothing is awaited: the pump runs the subscribers one
+        after another and errors are only logged. No task is created per
+        subscriber. Use publish() where the caller must know the subscribers are
+        done (e.g. during shutdown).
+        """
+        subscribers = self._subscribers.get(event.type, _EMPTY)
         
-        # Run all subscribers in parallel
-        async def call_subscriber(subscriber: Subscriber):
-            try:
-                await subscriber(event)
-            except Exception as e:
-                # Get class name if it's a bound method
-                class_name = subscriber.__self__.__class__.__name__ if hasattr(subscriber, '__self__') else ''
-                method_name = f"{class_name}.{subscriber.__name__}" if class_name else subscriber.__name__
-                logger.error(f"Error in subscriber {method_name}: {e}")
-                logger.trace(e)
+        if not subscribers:
+            return
         
-        await asyncio.gather(*[call_subscriber(sub) for sub in subscribers], return_exceptions=True)
+        if logger.level <= LogLevel.DEBUG:
+            logger.debug(f"📨 Scheduling {event.type} for {len(subscribers)} subscriber(s)")
+        
+        # Single pump, started on demand; it exits once the queue is drained.
+        # The tuple is never mutated, so the pump delivers to exactly this snapshot.
+        self._queue.put_nowait((event, subscribers))
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+
+    @staticmethod
+    async def _call_subscriber(subscriber: Subscriber, event: Event[Any]) -> None:
+        """Run one subscriber, logging instead of propagating its errors."""
+        try:
+            await subscriber(event)
+        except Exception as e:
+            # Get class name if it's a bound method
+            class_name = subscriber.__self__.__class__.__name__ if hasattr(subscriber, '__self__') else ''
+            method_name = f"{class_name}.{subscriber.__name__}" if class_name else subscriber.__name__
+            logger.error(f"Error in subscriber {method_name}: {e}")
+            logger.trace(e)
+
+    async def _pump(self) -> None:
+        """Run the subscribers of queued events in turn until the queue is empty."""
+        while not self._queue.empty():
+            event, subscribers = self._queue.get_nowait()
+            for sub in subscribers:
+                await self._call_subscriber(sub, event)
 
     async def shutdown(self):
-        """Clear all subscribers during shutdown."""
+        """Deliver events still queued by publish_nowait(), then clear all subscribers."""
+        if self._pump_task and not self._pump_task.done():
+            await self._pump_task
         logger.info("🔌 Clearing all event subscribers")
-        self._subscribers.clear()
+        with self._lock:
+            self._raw.clear()
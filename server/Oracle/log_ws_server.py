@@ -23,6 +23,9 @@ WS_PORT = int(ws_config.get("port", 8765))
 # -------------------------------------------------
 connected_clients = set()
 
+# Μέγιστο πλήθος γραμμών στην ουρά· όταν γεμίσει πετάμε την παλαιότερη
+QUEUE_MAXSIZE = 10_000
+
 
 async def log_tail_producer(queue: asyncio.Queue):
     """
@@ -48,9 +51,13 @@ async def log_tail_producer(queue: asyncio.Queue):
                 continue
 
             line = line.rstrip("\r\n")
-            print(line)
             if line:
-                await queue.put(line)
+                try:
+                    queue.put_nowait(line)
+                except asyncio.QueueFull:
+                    # Αργοί clients: κρατάμε τις πιο πρόσφατες γραμμές
+                    queue.get_nowait()
+                    queue.put_nowait(line)
 
 
 async def broadcaster(queue: asyncio.Queue):
@@ -63,19 +70,9 @@ async def broadcaster(queue: asyncio.Queue):
             # κανένας client, απλά συνέχισε
             continue
 
-        dead_clients = set()
-        msg = line
-
-        for ws in connected_clients:
-            try:
-                await ws.send(msg)
-            except Exception as e:
-                print(f"[broadcaster] client error: {e}")
-                dead_clients.add(ws)
-
-        # Καθαρισμός dead clients
-        for ws in dead_clients:
-            connected_clients.discard(ws)
+        # Το broadcast κάνει encode το frame μία φορά για όλους τους clients.
+        # Οι κλειστές συνδέσεις αγνοούνται και αφαιρούνται από τον ws_handler.
+        websockets.broadcast(connected_clients, line)
 
 
 async def ws_handler(websocket):
@@ -95,7 +92,7 @@ async def ws_handler(websocket):
 
 
 async def main():
-    queue = asyncio.Queue()
+    queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
 
     # Task που ακολουθεί το log
     tail_task = asyncio.create_task(log_tail_producer(queue))
@@ -1,12 +1,18 @@
 """Async price database utility for item pricing."""
 
+import asyncio
+import hashlib
 import json
 import aiohttp
+import orjson
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Tuple
 
+from tortoise.transactions import in_transaction
+
+from Oracle.database.database_manager import WRITER_CONNECTION
 from Oracle.database.models import PriceDataBaseRevision, PriceSource, Item
-from Oracle.parsing.utils.item_db import item_lookup
+from Oracle.parsing.utils.item_db import item_lookup, items_lookup
 from Oracle.events import EventBus
 from Oracle.services.events import ServiceEventType, ItemDataChangedEvent
 from Oracle.tooling.config import Config
@@ -17,6 +23,12 @@ from Oracle.tooling.singleton import SingletonMixin
 
 logger = Logger("PriceDB")
 
+# Rows per query when reading/writing the Item table in bulk
+UPSERT_BATCH_SIZE = 500
+
+# Remote price payloads at least this large are JSON-decoded off the event loop
+THREADED_DECODE_THRESHOLD = 1024 * 1024
+
 
 class PriceDB(SingletonMixin):
     """Async singleton class for item price lookups with caching."""
@@ -25,12 +37,23 @@ class PriceDB(SingletonMixin):
         """Initialize the price database."""
         self._cache: Dict[int, float] = {}
         self._loaded: bool = False
+        # get_price() may run per inventory event; warn about a missing price list only once
+        self._warned_not_loaded: bool = False
         self._event_bus: Optional[EventBus] = None
+        # Shared HTTP session so repeated refreshes reuse keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Remote price list URL, read once from config in initialize()
+        self._remote_url: Optional[str] = None
+        # Content hash of the last price_table.json read, stored with its LOCAL revision
+        self._local_hash: Optional[str] = None
         
         logger.info("💰 PriceDB instance created")
     
     async def initialize(self):
         """Initialize async components (called by Singleton decorator)."""
+        # Config is not reloaded at runtime, so the URL only needs reading once
+        self._remote_url = Config().get_value("price_db", "url")
+        
         # Get EventBus singleton instance
         self._event_bus = await EventBus.instance()
         
@@ -40,6 +63,23 @@ class PriceDB(SingletonMixin):
             ServiceEventType.ITEM_DATA_CHANGED
         )
         logger.debug("💰 PriceDB event handlers registered")
+        
+        self._session = self._create_session()
+    
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create the HTTP session used for remote price fetches."""
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        logger.debug("💰 PriceDB HTTP session closed")
     
     async def refresh_pricelist(self) -> bool:
         """
@@ -48,9 +88,7 @@ class PriceDB(SingletonMixin):
         Returns:
             True if prices were loaded successfully, False otherwise
         """
-        config = Config()
-        price_db_config = config.get("price_db")
-        remote_url = price_db_config.get("url")
+        remote_url = self._remote_url
         
         # Try to fetch from remote first
         if remote_url:
@@ -65,7 +103,7 @@ class PriceDB(SingletonMixin):
         logger.info("💰 Loading prices from local file")
         success = await self._load_local_prices()
         if success:
-            await self._save_revision(PriceSource.LOCAL)
+            await self._save_revision(PriceSource.LOCAL, self._local_hash)
         return success
     
     async def _load_remote_prices(self, url: str) -> bool:
@@ -79,32 +117,33 @@ class PriceDB(SingletonMixin):
             True if successful, False otherwise
         """
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.error(f"💰 Remote fetch failed with status {response.status}")
-                        return False
-                    
-                    data = await response.json()
-                    
-                    # Parse and cache prices
-                    self._cache.clear()
-                    for item_id_str, item_data in data.items():
-                        try:
-                            item_id = int(item_id_str)
-                            price = float(item_data.get("price", 0.0))
-                            self._cache[item_id] = price
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"💰 Invalid price data for item {item_id_str}: {e}")
-                    
-                    logger.info(f"💰 Loaded {len(self._cache)} item prices from remote")
-                    self._loaded = True
-                    return True
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+            
+            async with self._session.get(url) as response:
+                if response.status != 200:
+                    logger.error(f"💰 Remote fetch failed with status {response.status}")
+                    return False
+                
+                body = await response.read()
+            
+            # Large payloads are decoded in a worker thread so the event loop keeps running
+            if len(body) >= THREADED_DECODE_THRESHOLD:
+                data = await asyncio.to_thread(orjson.loads, body)
+            else:
+                data = orjson.loads(body)
+            del body  # Release the raw bytes before building the cache
+            
+            # Parse and cache prices
+            self._cache = self._build_price_cache(data)
+            
+            logger.info(f"💰 Loaded {len(self._cache)} item prices from remote")
+            self._loaded = True
+            return True
                     
         except aiohttp.ClientError as e:
             logger.error(f"💰 HTTP error fetching remote prices: {e}")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
             logger.error(f"💰 JSON decode error: {e}")
         except Exception as e:
             logger.error(f"💰 Unexpected error fetching remote prices: {e}")
@@ -151,47 +190,25 @@ class PriceDB(SingletonMixin):
                     await self._load_prices_from_db()
                     return False
             
+            with open(price_file, "rb") as f:
+                raw = f.read()
+            
+            # A touched but unchanged file (e.g. rewritten by an editor) needs no re-parse
+            self._local_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if latest_local_revision and latest_local_revision.content_hash == self._local_hash:
+                logger.info("💰 Local price file content unchanged since last load")
+                await self._load_prices_from_db()
+                return False
+            
             # Load from file
             logger.info(f"💰 Loading prices from file (modified: {file_mtime})")
-            with open(price_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(raw)
+            del raw
             
             # Convert string keys to integers and extract prices
-            self._cache.clear()
+            self._cache = self._build_price_cache(data)
             
-            for item_id_str, item_data in data.items():
-                try:
-                    item_id = int(item_id_str)
-                    price = float(item_data.get("price", 0.0))
-                    
-                    # Get name and category from item_db
-                    item_info = item_lookup(item_id)
-                    name = item_info.get("name")
-                    category = item_info.get("type")
-                    
-                    # Cache the price
-                    self._cache[item_id] = price
-                    
-                    # Update or create item in database
-                    item = await Item.get_or_none(item_id=item_id)
-                    if item:
-                        # Update existing item
-                        item.price = price
-                        if name:
-                            item.name = name
-                        if category:
-                            item.category = category
-                        await item.save()
-                    else:
-                        # Create new item
-                        await Item.create(
-                            item_id=item_id,
-                            name=name,
-                            category=category,
-                            price=price
-                        )
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"💰 Invalid price data for item {item_id_str}: {e}")
+            await self._upsert_items(self._cache)
             
             logger.info(f"💰 Loaded {len(self._cache)} item prices from local file and updated database")
             self._loaded = True
@@ -201,33 +218,115 @@ class PriceDB(SingletonMixin):
             logger.error(f"💰 Failed to load local price table: {e}")
             return False
     
+    @staticmethod
+    def _build_price_cache(data: Dict[str, dict]) -> Dict[int, float]:
+        """
+        Build the item_id -> price cache from a price table payload.
+        
+        Well-formed tables are converted with a single comprehension; only if that
+        fails are rows converted one by one so bad entries can be skipped and logged.
+        """
+        try:
+            return {int(k): float(v.get("price", 0.0)) for k, v in data.items()}
+        except (ValueError, TypeError):
+            pass
+        
+        cache: Dict[int, float] = {}
+        invalid = []
+        for item_id_str, item_data in data.items():
+            try:
+                cache[int(item_id_str)] = float(item_data.get("price", 0.0))
+            except (ValueError, TypeError) as e:
+                invalid.append((item_id_str, e))
+        for item_id_str, e in invalid:
+            logger.warning(f"💰 Invalid price data for item {item_id_str}: {e}")
+        return cache
+    
+    async def _upsert_items(self, prices: Dict[int, float]):
+        """
+        Write prices to the Item table in bulk, creating missing items.
+        
+        Existing items are fetched in chunks, then updates and inserts are flushed
+        with bulk_update/bulk_create. All of it runs in one writer transaction, so
+        the items read are the ones being updated.
+        
+        Args:
+            prices: Mapping of item_id to price
+        """
+        ids = list(prices)
+        
+        # Resolve names and categories from item_db in one pass
+        info = items_lookup(ids)
+        
+        async with in_transaction(WRITER_CONNECTION):
+            # Reads inside the transaction are routed to the writer (ReadWriteRouter)
+            existing: Dict[int, Item] = {}
+            for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+                chunk = ids[start:start + UPSERT_BATCH_SIZE]
+                for item in await Item.filter(item_id__in=chunk):
+                    existing[item.item_id] = item
+            
+            to_create = []
+            to_update = []
+            for item_id, price in prices.items():
+                item_info = info[item_id]
+                name = item_info.get("name")
+                category = item_info.get("type")
+                
+                item = existing.get(item_id)
+                if item:
+                    item.price = price
+                    if name:
+                        item.name = name
+                    if category:
+                        item.category = category
+                    to_update.append(item)
+                else:
+                    to_create.append(Item(item_id=item_id, name=name, category=category, price=price))
+            
+            if to_create:
+                await Item.bulk_create(to_create, batch_size=UPSERT_BATCH_SIZE)
+            if to_update:
+                await Item.bulk_update(
+                    to_update,
+                    fields=["price", "name", "category", "updated_at"],
+                    batch_size=UPSERT_BATCH_SIZE
+                )
+        
+        logger.debug(f"💰 Upserted items: {len(to_create)} created, {len(to_update)} updated")
+    
     async def _load_prices_from_db(self):
         """Load prices from Item table into cache."""
-        items = await Item.all()
-        
-        for item in items:
-            if item.price > 0:
-                self._cache[item.item_id] = item.price
+        rows = await Item.filter(price__gt=0).values_list("item_id", "price")
+        self._cache.update(rows)
         
         logger.info(f"💰 Loaded {len(self._cache)} prices from database")
         self._loaded = True
     
-    async def _save_revision(self, source: str):
+    async def _save_revision(self, source: str, content_hash: Optional[str] = None):
         """
         Save a price database revision record.
         
         Args:
             source: Source of the price data (PriceSource.LOCAL or PriceSource.REMOTE)
+            content_hash: Hash of the loaded file contents, for LOCAL revisions
         """
         try:
             await PriceDataBaseRevision.create(
                 source=source,
-                item_count=len(self._cache)
+                item_count=len(self._cache),
+                content_hash=content_hash
             )
             logger.info(f"💰 Saved price DB revision: {source}, {len(self._cache)} items")
         except Exception as e:
             logger.error(f"💰 Failed to save price DB revision: {e}")
     
+    def _warn_not_loaded(self):
+        """Log that prices are not loaded yet, once until the next reload."""
+        if not self._warned_not_loaded:
+            self._warned_not_loaded = True
+            logger.warning("💰 Price DB not loaded yet, returning 0.0")
+    
     def get_price(self, item_id: int) -> float:
         """
         Get the price for an item ID.
@@ -239,15 +338,36 @@ class PriceDB(SingletonMixin):
             The price of the item, or 0.0 if not found
         """
         if not self._loaded:
-            logger.warning("💰 Price DB not loaded yet, returning 0.0")
+            self._warn_not_loaded()
             return 0.0
         
         return self._cache.get(item_id, 0.0)
     
+    def total_value(self, quantities: Iterable[Tuple[int, float]]) -> float:
+        """
+        Get the combined value of (item_id, quantity) pairs.
+        
+        Bulk equivalent of summing get_price(item_id) * quantity, without a
+        method call and loaded check per item.
+        
+        Args:
+            quantities: Pairs of item ID and quantity (negative for losses)
+            
+        Returns:
+            The total value, or 0.0 if the price DB is not loaded
+        """
+        if not self._loaded:
+            self._warn_not_loaded()
+            return 0.0
+        
+        get = self._cache.get
+        return sum(get(item_id, 0.0) * qty for item_id, qty in quantities)
+    
     async def reload(self):
         """Reload prices by calling refresh_pricelist."""
         self._cache.clear()
         self._loaded = False
+        self._warned_not_loaded = False
         await self.refresh_pricelist()
     
     async def _on_item_data_changed(self, event: ItemDataChangedEvent):
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import List, Type
 
 from Oracle.parsing.loaders.base_loader import BaseLoader
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import PARSER_REGISTRY, ParserBase
 
 
 class DevelopmentLoader(BaseLoader):
@@ -27,8 +27,6 @@ class DevelopmentLoader(BaseLoader):
         Returns:
             List of parser class types
         """
-        parsers = []
-        
         for py_file in self.parsers_path.glob("*.py"):
             if py_file.stem.startswith("_") or py_file.stem == "base":
                 continue
@@ -41,19 +39,12 @@ class DevelopmentLoader(BaseLoader):
                 else:
                     module = importlib.import_module(module_name)
                     self._loaded_modules[py_file.stem] = module
-                
-                # Find ParserBase subclasses
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, ParserBase) and 
-                        attr is not ParserBase):
-                        parsers.append(attr)
                         
             except Exception as e:
                 print(f"[DevelopmentLoader] Failed to load {py_file.stem}: {e}")
-                
-        return parsers
+        
+        # Importing a module registers its parsers (see @register_parser)
+        return list(PARSER_REGISTRY.values())
 
     def reload_parsers(self) -> List[Type[ParserBase]]:
         """
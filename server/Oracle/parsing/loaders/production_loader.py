@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import List, Type
 
 from Oracle.parsing.loaders.base_loader import BaseLoader
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import PARSER_REGISTRY, ParserBase
 
 
 class ProductionLoader(BaseLoader):
@@ -32,11 +32,9 @@ class ProductionLoader(BaseLoader):
         Returns:
             List of parser class types
         """
-        parsers = []
-        
         if not self.modules_path.exists():
             print(f"[ProductionLoader] Modules path not found: {self.modules_path}")
-            return parsers
+            return []
         
         for pyz_file in self.modules_path.glob("*.pyz"):
             module_name = pyz_file.stem
@@ -53,19 +51,12 @@ class ProductionLoader(BaseLoader):
                 else:
                     module = importlib.import_module(module_name)
                     self._loaded_modules[module_name] = module
-                
-                # Find ParserBase subclasses
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, ParserBase) and 
-                        attr is not ParserBase):
-                        parsers.append(attr)
                         
             except Exception as e:
                 print(f"[ProductionLoader] Failed to load {module_name}: {e}")
-                
-        return parsers
+        
+        # Importing a module registers its parsers (see @register_parser)
+        return list(PARSER_REGISTRY.values())
 
     def reload_parsers(self) -> List[Type[ParserBase]]:
         """
@@ -1,49 +1,59 @@
 import re
 import asyncio
-from datetime import datetime
-from Oracle.parsing.parsers.parser_base import ParserBase
+from typing import Optional
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.bag_modify import BagModifyEvent
 from Oracle.parsing.utils.item_db import item_lookup
+from Oracle.parsing.utils.timestamps import parse_log_ts, split_log_line
 
+# Matched against the line body, after the [timestamp] prefix (see split_log_line)
 BAG_MODIFY_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+]\[\d+]"
+    r"\[\d+]"
     r"GameLog: Display: \[Game] BagMgr@\:Modfy BagItem "
     r"PageId = (\d+) SlotId = (\d+) ConfigBaseId = (\d+) Num = (\d+)"
 )
 
+# Cheap substring check that rejects unrelated lines before running the regex
+_BAG_TOKEN = "BagMgr@:Modfy BagItem"
 
-class BagModifyParser(ParserBase):
+
+@register_parser
+class BagModifyParser(LineParser):
     __PARSER__ = {
         "name": "BagModifyParser",
         "version": "0.0.1",
         "description": "Parses bag/inventory modification events"
     }
+    __TOKENS__ = (_BAG_TOKEN,)
     
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = BAG_MODIFY_RE.search(line)
+    def _parse_line(self, line: str) -> Optional[BagModifyEvent]:
+        if _BAG_TOKEN not in line:
+            return None
+
+        parts = split_log_line(line)
+        if not parts:
+            return None
+        ts_str, _ms_str, body_start = parts
+
+        m = BAG_MODIFY_RE.match(line, body_start)
         if not m:
-            return
+            return None
 
-        ts_str, page, slot, item_id, qty = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
-        item_id = int(item_id)
-        qty = int(qty)
+        item_id = int(m.group(3))
 
         item_info = item_lookup(item_id)
         name = item_info.get("name") if item_info else None
         category = item_info.get("type") if item_info else None
 
-        event = BagModifyEvent(
-            timestamp=timestamp,
-            page=int(page),
-            slot=int(slot),
+        return BagModifyEvent(
+            timestamp=parse_log_ts(ts_str),
+            page=int(m.group(1)),
+            slot=int(m.group(2)),
             item_id=item_id,
-            quantity=qty,
+            quantity=int(m.group(4)),
             name=name,
             category=category
         )
-
-        await self._emit(event)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 import re
 import asyncio
+import time
 from datetime import datetime
 from typing import AsyncGenerator, Optional
 from enum import Enum
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import ParserBase, register_parser
 from Oracle.parsing.parsers.events.enter_level import EnterLevelEvent
 from Oracle.parsing.parsers.maps import get_map_by_id
+from Oracle.parsing.utils.timestamps import parse_log_ts_ms, split_log_line
 from Oracle.tooling.logger import Logger
 
 logger = Logger("EnterLevelParser")
@@ -20,27 +22,36 @@ class ParseState(Enum):
     GOT_LEVEL_INFO = 2
 
 
-# Regex patterns for the 3-line sequence
+# Regex patterns for the 3-line sequence.
+# The "[timestamp]" prefix is split off by split_log_line, so each pattern only
+# covers the line body and is applied with match(line, body_start).
 # Line 1: [timestamp]GameLog: Display: [Game] LevelMgr@ EnterLevel
 ENTER_LEVEL_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})\].*GameLog: Display: \[Game\] LevelMgr@ EnterLevel$"
+    r".*GameLog: Display: \[Game\] LevelMgr@ EnterLevel$"
 )
 
 # Line 2: [timestamp]GameLog: Display: [Game] LevelMgr@ LevelUid, LevelType, LevelId = 1121002 3 5302
 # OR: [timestamp]GameLog: Display: [Game] LeevelLinkData： 1121102 3 5314
+# Both forms in one alternation: groups 1-3 for the first, 4-6 for the second.
 LEVEL_INFO_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})\].*GameLog: Display: \[Game\] LevelMgr@ LevelUid, LevelType, LevelId = (\d+) (\d+) (\d+)"
-)
-LEVEL_INFO_ALT_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})\].*GameLog: Display: \[Game\] LeevelLinkData[：:]\s*(\d+)\s+(\d+)\s+(\d+)"
+    r".*GameLog: Display: \[Game\] "
+    r"(?:LevelMgr@ LevelUid, LevelType, LevelId = (\d+) (\d+) (\d+)"
+    r"|LeevelLinkData[：:]\s*(\d+)\s+(\d+)\s+(\d+))"
 )
 
 # Line 3: [timestamp]GameLog: Display: [Game] LevelMgr@:LevelPath, Model = <path> <model>
 LEVEL_PATH_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})\].*GameLog: Display: \[Game\] LevelMgr@:LevelPath, Model = (.+)"
+    r".*GameLog: Display: \[Game\] LevelMgr@:LevelPath, Model = .+"
 )
 
+# Substrings each FSM state needs; lines without them skip the regex entirely
+ENTER_LEVEL_TOKEN = "LevelMgr@ EnterLevel"
+LEVEL_INFO_TOKEN = "LevelMgr@ LevelUid"
+LEVEL_INFO_ALT_TOKEN = "LeevelLinkData"
+LEVEL_PATH_TOKEN = "LevelMgr@:LevelPath"
+
 
+@register_parser
 class EnterLevelParser(ParserBase):
     __PARSER__ = {
         "name": "EnterLevelParser",
@@ -49,7 +60,7 @@ class EnterLevelParser(ParserBase):
     }
 
     def __init__(self):
-        super().__init__()  # Initialize ParserBase with asyncio.Queue
+        super().__init__()  # Initialize ParserBase's results buffer
         
         # FSM state
         self._state = ParseState.IDLE
@@ -61,8 +72,8 @@ class EnterLevelParser(ParserBase):
         # Counter for failed state transitions
         self._non_idle_counter = 0
         
-        # Timestamp of when we entered non-IDLE state (for timeout)
-        self._state_entered_at: Optional[datetime] = None
+        # Monotonic time (seconds) of when we entered non-IDLE state (for timeout)
+        self._state_entered_at: float = 0.0
         self._state_timeout_seconds = 2.0  # Reset if stuck for more than 5 seconds
 
     def _reset_fsm(self):
@@ -73,12 +84,12 @@ class EnterLevelParser(ParserBase):
         self._level_type = None
         self._level_id = None
         self._non_idle_counter = 0
-        self._state_entered_at = None
+        self._state_entered_at = 0.0
 
-    async def feed_line(self, line: str) -> None:
+    def feed_line(self, line: str) -> None:
         # Check for timeout if we're stuck in non-IDLE state
-        if self._state != ParseState.IDLE and self._state_entered_at is not None:
-            elapsed = (datetime.now() - self._state_entered_at).total_seconds()
+        if self._state != ParseState.IDLE:
+            elapsed = time.monotonic() - self._state_entered_at
             if elapsed > self._state_timeout_seconds:
                 logger.warning(
                     f'[EnterLevelParser] Timeout reset - stuck in {self._state.name} '
@@ -98,25 +109,28 @@ class EnterLevelParser(ParserBase):
         
         # State machine for 3-line parsing
         if self._state == ParseState.IDLE:
-            m = ENTER_LEVEL_RE.search(line)
+            if ENTER_LEVEL_TOKEN not in line:
+                return
+            parts = split_log_line(line)
+            m = ENTER_LEVEL_RE.match(line, parts[2]) if parts else None
             if m:
-                date_str, time_str, ms_str = m.groups()
-                self._timestamp = datetime.strptime(
-                    f"{date_str} {time_str}.{ms_str}",
-                    "%Y.%m.%d %H.%M.%S.%f"
-                )
+                ts_str, ms_str, _body_start = parts
+                date_str, _, time_str = ts_str.partition("-")
+                self._timestamp = parse_log_ts_ms(date_str, time_str, ms_str)
                 self._state = ParseState.GOT_ENTER
                 self._non_idle_counter = 0
-                self._state_entered_at = datetime.now()  # Track when we entered this state
+                self._state_entered_at = time.monotonic()  # Track when we entered this state
         
         elif self._state == ParseState.GOT_ENTER:
-            # Try both regex patterns for LEVEL_INFO
-            m = LEVEL_INFO_RE.search(line)
-            if not m:
-                m = LEVEL_INFO_ALT_RE.search(line)
+            # One pass covers both LEVEL_INFO forms
+            parts = split_log_line(line) if LEVEL_INFO_TOKEN in line or LEVEL_INFO_ALT_TOKEN in line else None
+            m = LEVEL_INFO_RE.match(line, parts[2]) if parts else None
             
             if m:
-                date_str, time_str, ms_str, uid, ltype, lid = m.groups()
+                if m.group(1) is not None:
+                    uid, ltype, lid = m.group(1, 2, 3)
+                else:
+                    uid, ltype, lid = m.group(4, 5, 6)
                 self._level_uid = int(uid)
                 self._level_type = int(ltype)
                 self._level_id = int(lid)
@@ -126,7 +140,8 @@ class EnterLevelParser(ParserBase):
                 pass
         
         elif self._state == ParseState.GOT_LEVEL_INFO:
-            m = LEVEL_PATH_RE.search(line)
+            parts = split_log_line(line) if LEVEL_PATH_TOKEN in line else None
+            m = LEVEL_PATH_RE.match(line, parts[2]) if parts else None
             if m:
                 # We got all 3 lines, create event
                 event = EnterLevelEvent(
@@ -137,8 +152,8 @@ class EnterLevelParser(ParserBase):
                     map=get_map_by_id(self._level_id)
                 )
                 
-                # Use ParserBase's _emit method with asyncio.Queue
-                await self._emit(event)
+                # Hand the event to ParserBase's results buffer
+                self._emit(event)
                 
                 # Reset FSM (successful parse)
                 self._reset_fsm()
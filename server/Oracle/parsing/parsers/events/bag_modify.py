@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BagModifyEvent(ParserEvent):
     page: int
     slot: int
@@ -15,23 +15,11 @@ class BagModifyEvent(ParserEvent):
     quantity: int
     name: Optional[str] = None
     category: Optional[str] = None
-    type: ParserEventType = ParserEventType.BAG_MODIFY
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "page": self.page,
-            "slot": self.slot,
-            "item_id": self.item_id,
-            "quantity": self.quantity,
-            "name": self.name,
-            "category": self.category,
-            "type": self.type,
-        }
+    type: str = ParserEventType.BAG_MODIFY.value
 
     def __repr__(self) -> str:
         parts = [
-            f"timestamp={self.timestamp.isoformat()}",
+            f"timestamp={self.timestamp_iso}",
             f"page={self.page}",
             f"slot={self.slot}",
             f"item_id={self.item_id}",
@@ -2,10 +2,10 @@ from dataclasses import dataclass
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ExitLevelEvent(ParserEvent):
-    type: ParserEventType = ParserEventType.EXIT_LEVEL
+    type: str = ParserEventType.EXIT_LEVEL.value
 
     def __repr__(self):
-        ts = self.timestamp.isoformat()
+        ts = self.timestamp_iso
         return f"<ExitLevelEvent @ {ts}>"
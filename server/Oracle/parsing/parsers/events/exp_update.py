@@ -4,10 +4,10 @@ from datetime import datetime
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ExpUpdateEvent(ParserEvent):
     """Event for experience/level updates."""
     timestamp: datetime
     experience: int  # Raw experience value
     level: int  # Current character level
-    type: ParserEventType = ParserEventType.EXP_UPDATE
+    type: str = ParserEventType.EXP_UPDATE.value
@@ -4,9 +4,9 @@ from datetime import datetime
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GameMessageEvent(ParserEvent):
     """Event for in-game system messages."""
     timestamp: datetime
     message: str  # The game message text
-    type: ParserEventType = ParserEventType.GAME_MESSAGE
+    type: str = ParserEventType.GAME_MESSAGE.value
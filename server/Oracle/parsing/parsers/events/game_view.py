@@ -2,22 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
 
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GameViewEvent(ParserEvent):
     view: str
-    type: ParserEventType = ParserEventType.GAME_VIEW
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "view": self.view,
-            "timestamp": self.timestamp.isoformat(),
-            "type": self.type,
-        }
+    type: str = ParserEventType.GAME_VIEW.value
 
     def __repr__(self) -> str:
-        return f"<GameViewEvent view='{self.view}' timestamp={self.timestamp.isoformat()}>"
+        return f"<GameViewEvent view='{self.view}' timestamp={self.timestamp_iso}>"
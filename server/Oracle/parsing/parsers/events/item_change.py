@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemChangeEvent(ParserEvent):
     item_id: int
     page: int
@@ -16,24 +16,11 @@ class ItemChangeEvent(ParserEvent):
     amount: int = 0  # BagNum (quantity), 0 for Delete actions
     name: Optional[str] = None
     category: Optional[str] = None
-    type: ParserEventType = ParserEventType.ITEM_CHANGE
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "action": self.action,
-            "item_id": self.item_id,
-            "amount": self.amount,
-            "page": self.page,
-            "slot": self.slot,
-            "name": self.name,
-            "category": self.category,
-            "type": self.type,
-        }
+    type: str = ParserEventType.ITEM_CHANGE.value
 
     def __repr__(self) -> str:
         parts = [
-            f"timestamp={self.timestamp.isoformat()}",
+            f"timestamp={self.timestamp_iso}",
             f"action={self.action}",
             f"item_id={self.item_id}",
             f"amount={self.amount}",
@@ -3,9 +3,9 @@ from datetime import datetime
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LoadingProgressEvent(ParserEvent):
     primary: int
     secondary_type: str
     secondary_progress: int
-    type: ParserEventType = ParserEventType.LOADING_PROGRESS
+    type: str = ParserEventType.LOADING_PROGRESS.value
@@ -4,12 +4,12 @@ from datetime import datetime
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapLoadedEvent(ParserEvent):
     timestamp: datetime
     map_path: str
-    type: ParserEventType = ParserEventType.MAP_LOADED
+    type: str = ParserEventType.MAP_LOADED.value
 
     def __repr__(self):
-        map_name = self.map_path.split('/')[-1] if self.map_path else "Unknown"
-        return f"<MapLoadedEvent {map_name} @ {self.timestamp.isoformat()}>"
+        map_name = self.map_path.rpartition('/')[2] or "Unknown"
+        return f"<MapLoadedEvent {map_name} @ {self.timestamp_iso}>"
@@ -7,10 +7,10 @@ from Oracle.parsing.parsers.events.parser_event import ParserEvent
 from Oracle.parsing.parsers.events.parser_event_type import ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarketPriceResponseEvent(ParserEvent):
     """Emitted when a market price response arrives (XchgSearchPrice response)."""
     request_id: int = 0
     prices: List[float] = field(default_factory=list)
     success: bool = False
-    type: ParserEventType = ParserEventType.MARKET_PRICE_RESPONSE
+    type: str = ParserEventType.MARKET_PRICE_RESPONSE.value
@@ -1,11 +1,88 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, Optional, Type
+
+import orjson
 
 from Oracle.parsing.parsers.events.parser_event_type import ParserEventType
 from Oracle.events.base_event import Event
 
 
-@dataclass(kw_only=True)
+# Every ParserEvent subclass, by class name (filled in by __init_subclass__)
+EVENT_REGISTRY: Dict[str, Type[ParserEvent]] = {}
+
+
+def _build_to_dict(cls: Type[ParserEvent]) -> Callable[[ParserEvent], Dict[str, Any]]:
+    """Generate a to_dict for one event class with its field list written out.
+    
+    ``timestamp`` becomes the memoized ISO string and ``type`` its plain string;
+    every other field is copied as is. Parser events never override their
+    ``type`` default, so its value is baked into the generated code as a constant.
+    """
+    items = []
+    for f in fields(cls):
+        if f.name.startswith('_'):
+            continue
+        if f.name == "timestamp":
+            value = "self.timestamp_iso"
+        elif f.name == "type":
+            value = repr(str(f.default)) if isinstance(f.default, str) else "str(self.type)"
+        else:
+            value = f"self.{f.name}"
+        items.append(f"{f.name!r}: {value}")
+    
+    source = f"def to_dict(self):\n    return {{{', '.join(items)}}}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    return to_dict
+
+
+def _first_to_dict(self: ParserEvent) -> Dict[str, Any]:
+    """Placeholder to_dict: generates the real one for this class on first call."""
+    cls = type(self)
+    cls.to_dict = _build_to_dict(cls)
+    return cls.to_dict(self)
+
+
+@dataclass(kw_only=True, slots=True)
 class ParserEvent(Event[ParserEventType]):
-    """Base class for all parser events."""
-    pass
+    """Base class for all parser events.
+    
+    Subclasses default ``type`` to the plain string value of their ParserEventType
+    member. It hashes and compares equal to the member, so subscriptions and
+    ``event.type == ParserEventType.X`` checks work unchanged, without the enum
+    machinery on every format or serialize.
+    """
+    # Memoized timestamp.isoformat(), filled in by timestamp_iso
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-formatted timestamp, computed on first access."""
+        if self._ts_iso is None:
+            self._ts_iso = self.timestamp_dt.isoformat()
+        return self._ts_iso
+
+    def to_json_bytes(self) -> bytes:
+        """JSON encoding of to_dict(), without building the intermediate dict.
+        
+        orjson reads the dataclass slots directly, skips ``_`` fields and writes
+        datetimes in isoformat(). Epoch-nanosecond timestamps still go through
+        to_dict() so they come out as ISO strings too.
+        """
+        if isinstance(self.timestamp, int):
+            return orjson.dumps(self.to_dict())
+        return orjson.dumps(self)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Explicit super(): zero-arg super() does not work in slotted dataclasses.
+        # @dataclass(slots=True) re-creates the class, which runs this hook again,
+        # so the slotted class is the one left in the registry.
+        super(ParserEvent, cls).__init_subclass__(**kwargs)
+        EVENT_REGISTRY[cls.__name__] = cls
+        # Fields are not known until @dataclass has run, so unless the class writes
+        # its own to_dict, it gets a placeholder that generates one on first use.
+        if "to_dict" not in cls.__dict__:
+            cls.to_dict = _first_to_dict
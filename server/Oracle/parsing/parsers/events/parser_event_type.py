@@ -1,8 +1,8 @@
 from __future__ import annotations
-from enum import Enum
+from Oracle.events.base_event import EventEnum
 
 
-class ParserEventType(str, Enum):
+class ParserEventType(EventEnum):
     """Event type enum that can be used as ParserEventType.VALUE and converts to lowercase string."""
     NONE = "none" 
     ITEM_CHANGE = "item_change"
@@ -29,6 +29,3 @@ class ParserEventType(str, Enum):
     PLAYER_JOIN = "player_join"
     MARKET_PRICE_REQUEST = "market_price_request"
     MARKET_PRICE_RESPONSE = "market_price_response"
-
-    def __str__(self) -> str:
-        return self.value
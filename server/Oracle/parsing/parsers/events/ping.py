@@ -2,22 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
 
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PingEvent(ParserEvent):
     ping: int
-    type: ParserEventType = ParserEventType.PING
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "ping": self.ping,
-            "type": self.type,
-        }
+    type: str = ParserEventType.PING.value
 
     def __repr__(self) -> str:
-        return f"<PingEvent ping={self.ping} @ {self.timestamp.isoformat()}>"
+        return f"<PingEvent ping={self.ping} @ {self.timestamp_iso}>"
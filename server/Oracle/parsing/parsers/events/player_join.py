@@ -5,11 +5,11 @@ from typing import Optional
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PlayerJoinEvent(ParserEvent):
     player_name: str
     mode: int
-    type: ParserEventType = ParserEventType.PLAYER_JOIN
+    type: str = ParserEventType.PLAYER_JOIN.value
     
     def __repr__(self) -> str:
-        return f"<PlayerJoinEvent player={self.player_name} mode={self.mode} @ {self.timestamp.isoformat() if self.timestamp else 'N/A'}>"
+        return f"<PlayerJoinEvent player={self.player_name} mode={self.mode} @ {self.timestamp_iso if self.timestamp else 'N/A'}>"
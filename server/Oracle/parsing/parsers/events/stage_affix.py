@@ -1,26 +1,27 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from Oracle.parsing.parsers.events import ParserEvent, ParserEventType
 
 
-@dataclass
+@dataclass(slots=True)
 class AffixModel:
     """Represents a single map affix ID and description."""
     affix_id: int
     description: Optional[str] = ""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StageAffixEvent(ParserEvent):
     """Represents a group of affixes applied to a map stage."""
     affixes: list[AffixModel]
     level_id: Optional[int] = None
-    type: ParserEventType = ParserEventType.STAGE_AFFIX
+    type: str = ParserEventType.STAGE_AFFIX.value
+    # Memoized __repr__; the event is not modified once emitted
+    _repr_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __repr__(self):
-        return (
-            f"<StageAffixEvent {len(self.affixes)} affixes "
-            f"@ {self.timestamp.isoformat()}>"
-            f"@ {self.level_id}" if self.level_id is not None else ""
-        )
+        if self._repr_cache is None:
+            base = f"<StageAffixEvent {len(self.affixes)} affixes @ {self.timestamp_iso}>"
+            self._repr_cache = base if self.level_id is None else f"{base}@ {self.level_id}"
+        return self._repr_cache
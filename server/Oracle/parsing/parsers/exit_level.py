@@ -1,43 +1,42 @@
 from __future__ import annotations
 import asyncio
 import re
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.exit_level import ExitLevelEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts_ms
 
-# Matches: [2025.11.25-22.21.53:442]
-TIMESTAMP_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
+# Timestamp and payload in one pattern, so each line is scanned once
+# Matches: [2025.11.25-22.21.53:442]...UGameMgr::ExitLevel()
+EXIT_RE = re.compile(
+    r"\[(?P<date>\d{4}\.\d{2}\.\d{2})-(?P<time>\d{2}\.\d{2}\.\d{2}):(?P<ms>\d{3})]"
+    r".*?UGameMgr::ExitLevel\(\)"
 )
 
-EXIT_RE = re.compile(r"UGameMgr::ExitLevel\(\)")
+EXIT_TOKEN = "UGameMgr::ExitLevel()"
 
 
-class ExitLevelParser(ParserBase):
+@register_parser
+class ExitLevelParser(LineParser):
     __PARSER__ = {
         "name": "ExitLevelParser",
         "version": "0.0.1",
         "description": "Parses level/map exit events"
     }
+    __TOKENS__ = (EXIT_TOKEN,)
 
     def __init__(self):
-        super().__init__()  # Initialize ParserBase with asyncio.Queue
+        super().__init__()  # Initialize ParserBase's results buffer
 
-    async def feed_line(self, line: str):
-        if not EXIT_RE.search(line):
-            return
+    def _parse_line(self, line: str) -> Optional[ExitLevelEvent]:
+        if EXIT_TOKEN not in line:
+            return None
 
-        m_ts = TIMESTAMP_RE.search(line)
-        if not m_ts:
-            return
+        m = EXIT_RE.match(line)
+        if not m:
+            return None
 
-        date_str, time_str, ms_str = m_ts.groups()
-        timestamp = datetime.strptime(
-            f"{date_str} {time_str}.{ms_str}",
-            "%Y.%m.%d %H.%M.%S.%f"
-        )
+        timestamp = parse_log_ts_ms(m.group("date"), m.group("time"), m.group("ms"))
 
-        event = ExitLevelEvent(timestamp=timestamp)
-        await self._emit(event)
+        return ExitLevelEvent(timestamp=timestamp)
@@ -1,10 +1,10 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.exp_update import ExpUpdateEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log line:
@@ -14,13 +14,17 @@ EXP_UPDATE_RE = re.compile(
     r"GameLog: Display: \[Game\] ExpMgr@UpdateExp Percent:(\d+) (\d+)"
 )
 
+EXP_UPDATE_TOKEN = "ExpMgr@UpdateExp"
 
-class ExpUpdateParser(ParserBase):
+
+@register_parser
+class ExpUpdateParser(LineParser):
     __PARSER__ = {
         "name": "ExpUpdateParser",
         "version": "0.0.1",
         "description": "Parses experience point updates"
     }
+    __TOKENS__ = (EXP_UPDATE_TOKEN,)
     """
     Parser for experience/level update events.
     Emits ExpUpdateEvent when character exp or level changes.
@@ -29,18 +33,16 @@ class ExpUpdateParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = EXP_UPDATE_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[ExpUpdateEvent]:
+        if EXP_UPDATE_TOKEN not in line:
+            return None
 
-        ts_str, exp_percent_str, level_str = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = EXP_UPDATE_RE.match(line)
+        if not m:
+            return None
 
-        event = ExpUpdateEvent(
-            timestamp=timestamp,
-            experience=int(exp_percent_str),
-            level=int(level_str)
+        return ExpUpdateEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            experience=int(m.group(2)),
+            level=int(m.group(3))
         )
-
-        await self._emit(event)
@@ -1,10 +1,10 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.game_message import GameMessageEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log line:
@@ -14,13 +14,17 @@ GAME_MESSAGE_RE = re.compile(
     r"GameLog: Display: \[Game\] MsgMgr@:Show MsgValue = (.+)"
 )
 
+GAME_MESSAGE_TOKEN = "MsgMgr@:Show"
 
-class GameMessageParser(ParserBase):
+
+@register_parser
+class GameMessageParser(LineParser):
     __PARSER__ = {
         "name": "GameMessageParser",
         "version": "0.0.1",
         "description": "Parses in-game messages and notifications"
     }
+    __TOKENS__ = (GAME_MESSAGE_TOKEN,)
     """
     Parser for in-game system messages.
     Emits GameMessageEvent when the game displays a message to the player.
@@ -29,17 +33,15 @@ class GameMessageParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = GAME_MESSAGE_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[GameMessageEvent]:
+        if GAME_MESSAGE_TOKEN not in line:
+            return None
 
-        ts_str, message = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = GAME_MESSAGE_RE.match(line)
+        if not m:
+            return None
 
-        event = GameMessageEvent(
-            timestamp=timestamp,
-            message=message.strip()
+        return GameMessageEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            message=m.group(2).strip()
         )
-
-        await self._emit(event)
@@ -1,10 +1,10 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.game_pause import GamePauseEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log lines:
@@ -15,13 +15,17 @@ GAME_PAUSE_RE = re.compile(
     r"GameLog: Display: \[Game\] UGameMgr::(AddGamePausedForUI|RemovePausedForUI)\(\)"
 )
 
+GAME_PAUSE_TOKEN = "PausedForUI"
 
-class GamePauseParser(ParserBase):
+
+@register_parser
+class GamePauseParser(LineParser):
     __PARSER__ = {
         "name": "GamePauseParser",
         "version": "0.0.1",
         "description": "Parses game pause/resume events"
     }
+    __TOKENS__ = (GAME_PAUSE_TOKEN,)
     """
     Parser for game pause/unpause events.
     Emits GamePauseEvent when game is paused or unpaused via UI.
@@ -30,20 +34,16 @@ class GamePauseParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = GAME_PAUSE_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[GamePauseEvent]:
+        if GAME_PAUSE_TOKEN not in line:
+            return None
 
-        ts_str, action = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = GAME_PAUSE_RE.match(line)
+        if not m:
+            return None
 
         # AddGamePausedForUI means game is paused, RemovePausedForUI means unpaused
-        is_paused = action == "AddGamePausedForUI"
-
-        event = GamePauseEvent(
-            timestamp=timestamp,
-            is_paused=is_paused
+        return GamePauseEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            is_paused=m.group(2) == "AddGamePausedForUI"
         )
-
-        await self._emit(event)
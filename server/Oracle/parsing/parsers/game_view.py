@@ -5,8 +5,9 @@ import re
 from datetime import datetime
 from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import ParserBase, register_parser
 from Oracle.parsing.parsers.events.game_view import GameViewEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts_ms, split_log_line
 
 
 # Example logs:
@@ -16,12 +17,17 @@ GAME_VIEW_RE = re.compile(
     r"CurRunView\s*=?=?\s*(?P<view>\w+)"
 )
 
+GAME_VIEW_TOKEN = "CurRunView"
+
+
+@register_parser
 class GameViewParser(ParserBase):
     __PARSER__ = {
         "name": "GameViewParser",
         "version": "0.0.1",
         "description": "Parses UI view and menu changes"
     }
+    __TOKENS__ = (GAME_VIEW_TOKEN,)
     """
     Streams game view changes: (e.g. FightCtrl, PCBagCtrl, SettingCtrl)
     Follows same async streaming pattern as ItemChangeParser.
@@ -31,7 +37,10 @@ class GameViewParser(ParserBase):
         super().__init__()
         self._last_view: Optional[str] = None
 
-    async def feed_line(self, line: str) -> None:
+    def feed_line(self, line: str) -> None:
+        if GAME_VIEW_TOKEN not in line:
+            return
+
         match = GAME_VIEW_RE.search(line)
         if not match:
             return
@@ -44,9 +53,18 @@ class GameViewParser(ParserBase):
 
         self._last_view = view
 
+        # Use the line's own timestamp like the other parsers; the clock is only a fallback
+        parts = split_log_line(line)
+        if parts:
+            ts_str, ms_str, _body_start = parts
+            date_str, _, time_str = ts_str.partition("-")
+            timestamp = parse_log_ts_ms(date_str, time_str, ms_str)
+        else:
+            timestamp = datetime.now()
+
         event = GameViewEvent(
             view=view,
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
         )
 
-        await self._emit(event)
+        self._emit(event)
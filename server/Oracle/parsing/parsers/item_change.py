@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.item_change import ItemChangeEvent
-from Oracle.parsing.utils.item_db import item_lookup
-from datetime import datetime
+from Oracle.parsing.utils.item_db import ITEM_TUPLE, load_items
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 # Example logs:
 # [2025.11.26-20.02.54:023][713]GameLog: Display: [Game] ItemChange@ Update Id=5028_50acee19-c8e1-11f0-8ac6-000000000015 BagNum=796 in PageId=102 SlotId=21
@@ -17,40 +17,50 @@ ITEM_RE = re.compile(
     r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+\]\[\s*\d+\]GameLog:\s*Display:\s*\[Game\]\s*ItemChange@\s+(Add|Update|Delete)\s+Id=(\d+)_\S+(?:\s+BagNum=(\d+))?\s+in\s+PageId=(\d+)\s+SlotId=(\d+)"
 )
 
-class ItemChangeParser(ParserBase):
+ITEM_CHANGE_TOKEN = "ItemChange@"
+
+
+@register_parser
+class ItemChangeParser(LineParser):
     __PARSER__ = {
         "name": "ItemChangeParser",
         "version": "0.0.1",
         "description": "Parses item quantity and state changes"
     }
+    __TOKENS__ = (ITEM_CHANGE_TOKEN,)
     """
     """
 
     def __init__(self) -> None:
         super().__init__()
+        if not ITEM_TUPLE:
+            load_items()
+        self._lookup = ITEM_TUPLE.get
+
+    def _parse_line(self, line: str) -> Optional[ItemChangeEvent]:
+        if ITEM_CHANGE_TOKEN not in line:
+            return None
 
-    async def feed_line(self, line: str) -> None:
-        m = ITEM_RE.search(line)
+        m = ITEM_RE.match(line)
         
         if not m:
             return None
 
-        timestamp_str, action, item_id_str, amount_str, page_str, slot_str = m.groups()
-        timestamp = datetime.strptime(timestamp_str, "%Y.%m.%d-%H.%M.%S")
-
-        item_id = int(item_id_str)
-        page = int(page_str)
-        slot = int(slot_str)
+        timestamp = parse_log_ts(m.group(1))
+        action = m.group(2)
+        item_id = int(m.group(3))
+        page = int(m.group(5))
+        slot = int(m.group(6))
         
         # BagNum is optional (missing for Delete actions)
+        amount_str = m.group(4)
         amount = int(amount_str) if amount_str else 0
 
-        # Find extra metadata from item_lookup
-        item_info = item_lookup(item_id)
-        name = item_info.get("name") if item_info else None
-        category = item_info.get("type") if item_info else None
+        # Find extra metadata from the item table
+        info = self._lookup(item_id)
+        name, category = info if info else (None, None)
 
-        event = ItemChangeEvent(
+        return ItemChangeEvent(
             item_id=item_id,
             action=action,
             amount=amount,
@@ -60,5 +70,3 @@ class ItemChangeParser(ParserBase):
             category=category,
             timestamp=timestamp,
         )
-
-        await self._emit(event)
@@ -1,51 +1,48 @@
 from __future__ import annotations
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.loading_progress import LoadingProgressEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts_ms
 
 
-TIMESTAMP_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
-)
-
+# Timestamp and payload in one pattern, so each line is scanned once
+# [2025.11.25-22.21.53:442]...Loading@ P=40,S=Map 60%
 LOADING_RE = re.compile(
-    r"Loading@\s+P=(\d+),S=([A-Za-z]+)\s+(\d+)%"
+    r"\[(?P<date>\d{4}\.\d{2}\.\d{2})-(?P<time>\d{2}\.\d{2}\.\d{2}):(?P<ms>\d{3})]"
+    r".*?Loading@\s+P=(?P<primary>\d+),S=(?P<secondary_type>[A-Za-z]+)\s+(?P<secondary>\d+)%"
 )
 
+LOADING_TOKEN = "Loading@"
+
 
-class LoadingProgressParser(ParserBase):
+@register_parser
+class LoadingProgressParser(LineParser):
     __PARSER__ = {
         "name": "LoadingProgressParser",
         "version": "0.0.1",
         "description": "Parses loading screen progress events"
     }
+    __TOKENS__ = (LOADING_TOKEN,)
 
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str) -> None:
-        m_ts = TIMESTAMP_RE.search(line)
-        m = LOADING_RE.search(line)
-        if not m or not m_ts:
-            return
+    def _parse_line(self, line: str) -> Optional[LoadingProgressEvent]:
+        if LOADING_TOKEN not in line:
+            return None
 
-        date_str, time_str, ms_str = m_ts.groups()
-        timestamp = datetime.strptime(
-            f"{date_str} {time_str}.{ms_str}",
-            "%Y.%m.%d %H.%M.%S.%f"
-        )
+        m = LOADING_RE.match(line)
+        if not m:
+            return None
 
-        primary_str, secondary_type, secondary_str = m.groups()
+        timestamp = parse_log_ts_ms(m.group("date"), m.group("time"), m.group("ms"))
 
-        model = LoadingProgressEvent(
+        return LoadingProgressEvent(
             timestamp=timestamp,
-            primary=int(primary_str),
-            secondary_type=secondary_type,
-            secondary_progress=int(secondary_str),
+            primary=int(m.group("primary")),
+            secondary_type=m.group("secondary_type"),
+            secondary_progress=int(m.group("secondary")),
         )
-
-        await self._emit(model)
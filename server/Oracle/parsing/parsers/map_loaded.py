@@ -1,10 +1,10 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.map_loaded import MapLoadedEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log line:
@@ -14,13 +14,17 @@ MAP_LOADED_RE = re.compile(
     r"GameLog: Display: \[Game\] SceneLevelMgr@ OpenMainWorld END! InMainLevelPath = (.+)"
 )
 
+MAP_LOADED_TOKEN = "OpenMainWorld END"
 
-class MapLoadedParser(ParserBase):
+
+@register_parser
+class MapLoadedParser(LineParser):
     __PARSER__ = {
         "name": "MapLoadedParser",
         "version": "0.0.1",
         "description": "Parses map loaded and ready events"
     }
+    __TOKENS__ = (MAP_LOADED_TOKEN,)
     """
     Parser for map loaded events.
     Emits MapLoadedEvent when a main world map is fully loaded.
@@ -29,17 +33,15 @@ class MapLoadedParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = MAP_LOADED_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[MapLoadedEvent]:
+        if MAP_LOADED_TOKEN not in line:
+            return None
 
-        ts_str, map_path = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = MAP_LOADED_RE.match(line)
+        if not m:
+            return None
 
-        event = MapLoadedEvent(
-            timestamp=timestamp,
-            map_path=map_path.strip()
+        return MapLoadedEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            map_path=m.group(2).strip()
         )
-
-        await self._emit(event)
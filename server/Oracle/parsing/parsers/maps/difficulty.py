@@ -1,16 +1,18 @@
 # Oracle/parsing/parsers/maps/difficulty.py
 
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 
 class OrderedEnumMixin:
     """Mixin to add ordered list functionality to Enums."""
     
     @classmethod
-    def to_list(cls) -> List['Difficulty']:
-        """Return ordered list of enum values."""
-        return list(cls)
+    @lru_cache(maxsize=None)
+    def to_list(cls) -> Tuple['Difficulty', ...]:
+        """Return ordered tuple of enum values (built once per enum)."""
+        return tuple(cls)
     
     @classmethod
     def index_of(cls, value: 'Difficulty') -> int:
@@ -6,7 +6,7 @@ from typing import Optional
 from Oracle.parsing.parsers.maps.difficulty import Difficulty
 
 
-@dataclass
+@dataclass(slots=True)
 class MapData:
     """Map information data class."""
     map_id: str
@@ -2,8 +2,8 @@
 
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
-from copy import deepcopy
+from dataclasses import replace
+from typing import Optional, Dict, Any, Tuple
 
 from Oracle.tooling.logger import Logger
 from Oracle.tooling.paths import get_config_path
@@ -14,14 +14,42 @@ logger = Logger('maps.util')
 
 # Static cache for map data
 _MAP_DB: Optional[Dict[str, MapData]] = None
+# Derived map ID -> (reference map key, difficulty), built alongside _MAP_DB
+_TIER_INDEX: Dict[int, Tuple[str, Difficulty]] = {}
+
+
+def _build_tier_index(db: Dict[str, MapData]) -> Dict[int, Tuple[str, Difficulty]]:
+    """
+    Precompute the tier of every map ID the search in _get_difficulty_from_id can derive.
+    
+    An unknown map_id takes the tier of the first known map found by adding 100
+    increments: a known map K yields K - 100 * offset at difficulty_list[offset - 1].
+    Offsets are filled in ascending order, so the nearest known map wins.
+    Values are (reference map key, derived difficulty).
+    """
+    difficulty_list = Difficulty.to_list()
+    known_ids = []
+    for key in db:
+        try:
+            known_ids.append((int(key), key))
+        except ValueError:
+            continue
+    
+    index: Dict[int, Tuple[str, Difficulty]] = {}
+    for offset in range(1, len(difficulty_list)):
+        difficulty = difficulty_list[offset - 1]
+        for known_id, key in known_ids:
+            index.setdefault(known_id - 100 * offset, (key, difficulty))
+    return index
 
 
 def _get_difficulty_from_id(map_id: str) -> Optional[Difficulty]:
     """
-    Determine difficulty tier from map ID using search algorithm.
+    Determine difficulty tier from map ID using the precomputed tier index.
     
     For a given map_id that doesn't exist, we search by adding 100 increments
     until we find an existing map, then calculate the difficulty offset.
+    The search itself is done once for all IDs at load time (see _build_tier_index).
     
     Example:
     - map_id 5105 doesn't exist
@@ -29,43 +57,27 @@ def _get_difficulty_from_id(map_id: str) -> Optional[Difficulty]:
     - Offset: 1 (we added 100 once)
     - Result: difficulty_list[1 + 1] = T8_1
     """
-    difficulty_list = Difficulty.to_list()
-    logger.debug(f"Difficulty list: {[str(d) for d in difficulty_list]}") 
     try:
         base_id = int(map_id)
     except (ValueError, TypeError):
         raise ValueError(f"Invalid map_id: {map_id}")
     
-    # Check if this exact ID exists in our DB
     db = _load_map_db()
-    # Search upwards to find the tier
-    search_id = base_id
-    offset = 0
-
-    while offset < len(difficulty_list):
-        search_key = str(search_id)
-        if search_key in db and search_id != base_id:
-            # Found a reference map
-            assert(offset < len(difficulty_list))
-
-            new_difficulty = difficulty_list[offset - 1]
-            # Update the db with a new MapData including difficulty_list[-offset]}")
-            original_map = deepcopy(db[search_key])
-            original_map.map_id = map_id
-            original_map.difficulty = new_difficulty
-            db[map_id] = original_map
-            return new_difficulty
-        
-        search_id += 100
-        offset += 1
+    found = _TIER_INDEX.get(base_id)
+    if found is None:
+        # If we didn't find anything, assume T8+ (index 0)
+        return Difficulty.to_list()[0]
     
-    # If we didn't find anything, assume T8+ (index 0)
-    return difficulty_list[0]
+    search_key, new_difficulty = found
+    # Update the db with a copy of the reference map at the derived tier.
+    # MapData is flat (strings + an enum), so a shallow replace() is enough.
+    db[map_id] = replace(db[search_key], map_id=map_id, difficulty=new_difficulty)
+    return new_difficulty
     
 
 def _load_map_db() -> Dict[str, MapData]:
     """Load map database from en_id_map_table.json (cached)."""
-    global _MAP_DB
+    global _MAP_DB, _TIER_INDEX
     
     if _MAP_DB is not None:
         return _MAP_DB
@@ -90,6 +102,7 @@ def _load_map_db() -> Dict[str, MapData]:
         )
         for map_id, data in raw_data.items()
     }
+    _TIER_INDEX = _build_tier_index(_MAP_DB)
     
     return _MAP_DB
 
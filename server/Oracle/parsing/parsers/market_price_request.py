@@ -4,14 +4,11 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import ParserBase, register_parser
 from Oracle.parsing.parsers.events.market_price_request import MarketPriceRequestEvent
+from Oracle.parsing.utils.timestamps import parse_line_ts
 
 
-TIMESTAMP_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
-)
-
 # SendMessage STT----XchgSearchPrice----SynId = 237797
 REQUEST_START_RE = re.compile(
     r"SendMessage STT----XchgSearchPrice----SynId\s*=\s*(\d+)"
@@ -27,13 +24,18 @@ MESSAGE_END_RE = re.compile(
     r"----Socket SendMessage End----"
 )
 
+# Every line this parser reacts to carries one of these; the rest are no-ops
+REQUEST_TOKENS = ("SendMessage STT----XchgSearchPrice", "+refer", "----Socket SendMessage End----")
 
+
+@register_parser
 class MarketPriceRequestParser(ParserBase):
     __PARSER__ = {
         "name": "MarketPriceRequestParser",
         "version": "0.0.1",
         "description": "Parses market price search requests to auction house"
     }
+    __TOKENS__ = REQUEST_TOKENS
 
     def __init__(self):
         super().__init__()
@@ -48,24 +50,15 @@ class MarketPriceRequestParser(ParserBase):
         self._item_id = 0
         self._block_timestamp = None
 
-    async def feed_line(self, line: str) -> None:
-        # Parse timestamp
-        ts = None
-        m_ts = TIMESTAMP_RE.search(line)
-        if m_ts:
-            date_str, time_str, ms_str = m_ts.groups()
-            ts = datetime.strptime(
-                f"{date_str} {time_str}.{ms_str}",
-                "%Y.%m.%d %H.%M.%S.%f"
-            )
-
+    def feed_line(self, line: str) -> None:
         # Start: SendMessage XchgSearchPrice with SynId
         m_start = REQUEST_START_RE.search(line)
         if m_start:
             self._collecting = True
             self._request_id = int(m_start.group(1))
             self._item_id = 0
-            self._block_timestamp = ts
+            # Only block starts need the timestamp, so other lines skip parsing it
+            self._block_timestamp = parse_line_ts(line)
             return
 
         if not self._collecting:
@@ -87,6 +80,6 @@ class MarketPriceRequestParser(ParserBase):
                     request_id=self._request_id,
                     item_id=self._item_id,
                 )
-                await self._emit(event)
+                self._emit(event)
             self._reset()
             return
@@ -4,14 +4,11 @@ import re
 from datetime import datetime
 from typing import Optional, List
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import ParserBase, register_parser
 from Oracle.parsing.parsers.events.market_price_response import MarketPriceResponseEvent
+from Oracle.parsing.utils.timestamps import parse_line_ts
 
 
-TIMESTAMP_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
-)
-
 # RecvMessage STT----XchgSearchPrice----SynId = 237797
 RESPONSE_START_RE = re.compile(
     r"RecvMessage STT----XchgSearchPrice----SynId\s*=\s*(\d+)"
@@ -37,7 +34,10 @@ SEARCH_SUCCESS_RE = re.compile(
     r"Func_dealSearch_searchSuccess"
 )
 
+RESPONSE_START_TOKEN = "RecvMessage STT----XchgSearchPrice"
 
+
+@register_parser
 class MarketPriceResponseParser(ParserBase):
     __PARSER__ = {
         "name": "MarketPriceResponseParser",
@@ -60,16 +60,11 @@ class MarketPriceResponseParser(ParserBase):
         self._prices = []
         self._block_timestamp = None
 
-    async def feed_line(self, line: str) -> None:
-        # Parse timestamp
-        ts = None
-        m_ts = TIMESTAMP_RE.search(line)
-        if m_ts:
-            date_str, time_str, ms_str = m_ts.groups()
-            ts = datetime.strptime(
-                f"{date_str} {time_str}.{ms_str}",
-                "%Y.%m.%d %H.%M.%S.%f"
-            )
+    def feed_line(self, line: str) -> None:
+        # Outside a block only the start line matters. Inside one every line counts
+        # (a non-price line closes the price list), so no router tokens here.
+        if not self._collecting and RESPONSE_START_TOKEN not in line:
+            return
 
         # Start: RecvMessage XchgSearchPrice with SynId
         m_start = RESPONSE_START_RE.search(line)
@@ -77,7 +72,8 @@ class MarketPriceResponseParser(ParserBase):
             self._collecting = True
             self._request_id = int(m_start.group(1))
             self._prices = []
-            self._block_timestamp = ts
+            # Only block starts need the timestamp, so other lines skip parsing it
+            self._block_timestamp = parse_line_ts(line)
             return
 
         if not self._collecting:
@@ -113,6 +109,6 @@ class MarketPriceResponseParser(ParserBase):
                     prices=self._prices.copy(),
                     success=True,
                 )
-                await self._emit(event)
+                self._emit(event)
             self._reset()
             return
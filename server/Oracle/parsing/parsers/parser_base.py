@@ -1,39 +1,152 @@
 import asyncio
-from typing import AsyncGenerator, Optional
+from collections import deque
+from typing import AsyncGenerator, Deque, Dict, Iterable, List, Optional, Tuple, Type
 
 
 from Oracle.parsing.parsers.events import ParserEvent
+from Oracle.tooling.logger import Logger
+
+logger = Logger("Parser")
 
 
 class ParserBase:
     """
     Base class for all parsers.
     """
+    # Substrings a line must contain for this parser to care about it. The router
+    # only feeds a parser the lines containing one of its tokens; parsers without
+    # tokens (e.g. multi-line state machines) are fed every line.
+    __TOKENS__: Tuple[str, ...] = ()
+
     def __init__(self) -> None:
-        self._queue: asyncio.Queue[ParserEvent] = asyncio.Queue()
+        # Single producer (feed_line) and single consumer (results) on one loop,
+        # so a deque plus a wake-up flag is enough; no per-event futures or locks.
+        self._buf: Deque[ParserEvent] = deque()
+        self._has_data = asyncio.Event()
         self._running: bool = True
+        # While feed_lines() runs, _emit() collects events here instead of queueing them
+        self._batch: Optional[List[ParserEvent]] = None
 
     def stop(self) -> None:
         """Tell the parser no more data will come"""
         self._running = False
+        # Wake results() so it can drain what is left and return
+        self._has_data.set()
 
-    async def feed_line(self, line: str) -> None:
+    def feed_line(self, line: str) -> None:
         """
         Should be implemented by subclasses.
-        Called for every new log line to parse.
+        Called for every new log line to parse. Parsing is pure CPU work, so this
+        runs synchronously; it must not block on I/O.
         """
         raise NotImplementedError
 
-    async def _emit(self, obj: ParserEvent) -> None:
-        """Push parsed model to the async queue"""
-        await self._queue.put(obj)
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """
+        Feed a batch of log lines.
+        Events emitted while parsing the batch are queued together at the end.
+        A line that raises is logged and skipped; the rest of the batch is still fed.
+        Subclasses may override this with a tighter loop (see LineParser).
+        """
+        batch: List[ParserEvent] = []
+        self._batch = batch
+        try:
+            for line in lines:
+                try:
+                    self.feed_line(line)
+                except Exception as e:
+                    self._line_failed(e)
+        finally:
+            self._batch = None
+            if batch:
+                self._emit_many(batch)
+
+    def _line_failed(self, e: Exception) -> None:
+        """Log a line this parser could not handle; the caller skips just that line."""
+        logger.error(f"Parser {self.__class__.__name__}: {e}")
+        logger.trace(e)
+
+    def _emit(self, obj: ParserEvent) -> None:
+        """Push parsed model to the results buffer"""
+        if self._batch is not None:
+            self._batch.append(obj)
+            return
+        self._buf.append(obj)
+        self._has_data.set()
+
+    def _emit_many(self, objs: Iterable[ParserEvent]) -> None:
+        """Push several parsed models to the results buffer in one go"""
+        self._buf.extend(objs)
+        self._has_data.set()
 
     async def results(self) -> AsyncGenerator[ParserEvent, None]:
         """
         Async generator that yields parsed objects as they become available.
         Blocks waiting when none exist, until parser is stopped.
         """
-        while self._running or not self._queue.empty():
-            item: Optional[ParserEvent] = await self._queue.get()
-            yield item
-            self._queue.task_done()
+        async for batch in self.results_batch():
+            for item in batch:
+                yield item
+
+    async def results_batch(self, max_batch: int = 128) -> AsyncGenerator[List[ParserEvent], None]:
+        """
+        Like results(), but yields the buffered events as lists of up to max_batch,
+        so consumers pay one await per burst instead of one per event.
+        """
+        buf = self._buf
+        while self._running or buf:
+            if not buf:
+                self._has_data.clear()
+                await self._has_data.wait()
+                continue
+            if len(buf) <= max_batch:
+                batch = list(buf)
+                buf.clear()
+            else:
+                batch = [buf.popleft() for _ in range(max_batch)]
+            yield batch
+
+
+class LineParser(ParserBase):
+    """
+    Base for parsers that turn a single matching line into at most one event.
+    Subclasses implement the synchronous _parse_line(); feed_lines() then parses
+    a whole batch in one loop and queues the events once.
+    """
+
+    def _parse_line(self, line: str) -> Optional[ParserEvent]:
+        """
+        Should be implemented by subclasses.
+        Returns the event for this line, or None if the line is not relevant.
+        """
+        raise NotImplementedError
+
+    def feed_line(self, line: str) -> None:
+        event = self._parse_line(line)
+        if event:
+            self._emit(event)
+
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        events: List[ParserEvent] = []
+        for line in lines:
+            try:
+                event = self._parse_line(line)
+            except Exception as e:
+                # One malformed line must not cost the rest of the batch
+                self._line_failed(e)
+                continue
+            if event:
+                events.append(event)
+        if events:
+            self._emit_many(events)
+
+
+# Parser classes announced by @register_parser at import time. Keyed by
+# qualified name so reloading a module replaces its entry instead of adding one.
+PARSER_REGISTRY: Dict[str, Type[ParserBase]] = {}
+
+
+def register_parser(cls: Type[ParserBase]) -> Type[ParserBase]:
+    """Class decorator that makes a parser discoverable by the loaders."""
+    PARSER_REGISTRY[f"{cls.__module__}.{cls.__qualname__}"] = cls
+    return cls
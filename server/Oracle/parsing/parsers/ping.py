@@ -1,39 +1,36 @@
 import re
-from asyncio import Event
-from datetime import datetime
-from Oracle.parsing.parsers.parser_base import ParserBase
+from typing import Optional
+
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.ping import PingEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 PING_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+\]\[\d+\]GameLog: Display: \[Game\] TCP Ping Result: (\d+)"
+    r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+\]\[\d+\]GameLog: Display: \[Game\] TCP Ping Result: (\d+)",
+    re.ASCII  # \d only tests 0-9, which is all the game writes
 )
 
+PING_TOKEN = "TCP Ping Result"
+
 
-class PingParser(ParserBase):
+@register_parser
+class PingParser(LineParser):
     __PARSER__ = {
         "name": "PingParser",
         "version": "0.0.1",
         "description": "Parses network ping events"
     }
+    __TOKENS__ = (PING_TOKEN,)
     def __init__(self):
-        self._items = []
-        self._event = Event()
+        super().__init__()
 
-    async def feed_line(self, line: str):
-        m = PING_RE.search(line)
+    def _parse_line(self, line: str) -> Optional[PingEvent]:
+        if PING_TOKEN not in line:
+            return None
+
+        m = PING_RE.match(line)
         if not m:
-            return
-        
-        ts_str, ping_str = m.groups()
-        ts = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
-        
-        ev = PingEvent(timestamp=ts, ping=int(ping_str))
-        self._items.append(ev)
-        self._event.set()
-
-    async def results(self):
-        while True:
-            await self._event.wait()
-            while self._items:
-                yield self._items.pop(0)
-            self._event.clear()
+            return None
+
+        ts_str, ping = m.groups()
+        return PingEvent(timestamp=parse_log_ts(ts_str), ping=int(ping))
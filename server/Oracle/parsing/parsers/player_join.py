@@ -1,11 +1,11 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.player_join import PlayerJoinEvent
 from Oracle.tooling.logger import Logger
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 logger = Logger("PlayerJoinParser")
 
@@ -15,16 +15,21 @@ logger = Logger("PlayerJoinParser")
 # Note: There might be a space after the bracket: [ 23]GameLog or [944]GameLog
 PLAYER_JOIN_RE = re.compile(
     r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+\]\[\s*\d+\]\s*"
-    r"GameLog: Display: \[Game\]\s+SwitchBattleAreaUtil:_JoinFight\s+([^:]+):(\d+)"
+    r"GameLog: Display: \[Game\]\s+SwitchBattleAreaUtil:_JoinFight\s+([^:]+):(\d+)",
+    re.ASCII  # \d and \s only test ASCII; player names still match anything but ':'
 )
 
+PLAYER_JOIN_TOKEN = "_JoinFight"
 
-class PlayerJoinParser(ParserBase):
+
+@register_parser
+class PlayerJoinParser(LineParser):
     __PARSER__ = {
         "name": "PlayerJoinParser",
         "version": "0.0.1",
         "description": "Parses player join and session start events"
     }
+    __TOKENS__ = (PLAYER_JOIN_TOKEN,)
     """
     Parses player join events.
     Example: [Game] SwitchBattleAreaUtil:_JoinFight Eryndor#7291:1100
@@ -33,18 +38,18 @@ class PlayerJoinParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str) -> None:
-        match = PLAYER_JOIN_RE.search(line)
-        if not match:
-            return
+    def _parse_line(self, line: str) -> Optional[PlayerJoinEvent]:
+        if PLAYER_JOIN_TOKEN not in line:
+            return None
 
-        ts_str, player_name, mode_str = match.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        match = PLAYER_JOIN_RE.match(line)
+        if not match:
+            return None
 
-        event = PlayerJoinEvent(
-            timestamp=timestamp,
+        ts_str, player_name, mode = match.groups()
+        return PlayerJoinEvent(
+            timestamp=parse_log_ts(ts_str),
             player_name=player_name,
-            mode=int(mode_str)
+            mode=int(mode)
         )
         
-        await self._emit(event)
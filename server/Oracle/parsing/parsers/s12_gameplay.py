@@ -1,26 +1,31 @@
 import re
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.s12_gameplay import S12GameplayEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log line:
 # [2025.11.29-02.06.37:848][ 29]GameLog: Display: [Game] UGamePlayMgr::PlayS12GamePlayBGM layer=1
 S12_GAMEPLAY_RE = re.compile(
     r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):\d+\]\[\s*\d+\]"
-    r"GameLog: Display: \[Game\] UGamePlayMgr::PlayS12GamePlayBGM layer=(\d+)"
+    r"GameLog: Display: \[Game\] UGamePlayMgr::PlayS12GamePlayBGM layer=(\d+)",
+    re.ASCII  # \d and \s only test ASCII, which is all the game writes
 )
 
+S12_GAMEPLAY_TOKEN = "PlayS12GamePlayBGM"
 
-class S12GameplayParser(ParserBase):
+
+@register_parser
+class S12GameplayParser(LineParser):
     __PARSER__ = {
         "name": "S12GameplayParser",
         "version": "0.0.1",
         "description": "Parses Season 12 specific gameplay events"
     }
+    __TOKENS__ = (S12_GAMEPLAY_TOKEN,)
     """
     Parser for S12 gameplay BGM events.
     Emits S12GameplayEvent when BGM layer changes.
@@ -29,17 +34,16 @@ class S12GameplayParser(ParserBase):
     def __init__(self):
         super().__init__()
 
-    async def feed_line(self, line: str):
-        m = S12_GAMEPLAY_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[S12GameplayEvent]:
+        if S12_GAMEPLAY_TOKEN not in line:
+            return None
 
-        ts_str, layer_str = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = S12_GAMEPLAY_RE.match(line)
+        if not m:
+            return None
 
-        event = S12GameplayEvent(
-            timestamp=timestamp,
-            layer=int(layer_str)
+        ts_str, layer = m.groups()
+        return S12GameplayEvent(
+            timestamp=parse_log_ts(ts_str),
+            layer=int(layer)
         )
-
-        await self._emit(event)
@@ -4,45 +4,33 @@ import asyncio
 from datetime import datetime
 from typing import AsyncGenerator, Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import ParserBase, register_parser
 from Oracle.parsing.parsers.events.stage_affix import StageAffixEvent, AffixModel
+from Oracle.parsing.utils.timestamps import parse_line_ts
 
 
-TIMESTAMP_RE = re.compile(
-    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
+# One pass per line: whichever marker the line carries is reported by m.lastgroup
+STAGE_AFFIX_RE = re.compile(
+    r"(?P<enter>EnterLevel\((?P<level_id>\d+)\))"
+    r"|(?P<start>AffixInfos)"
+    r"|(?P<end>OnEnterAreaEnd\(\))"
+    r"|(?P<danger>\+DangerNumbers)"
+    r"|(?P<desc>\+Description\s*\[(?P<description>.*?)\])"
+    r"|(?P<id>\+Id\s*\[(?P<affix_id>\d+)\])"
 )
 
-ENTER_LEVEL_RE = re.compile(
-    r"EnterLevel\((\d+)\)"
-)
-
-AFFIX_LIST_START_RE = re.compile(
-    r"AffixInfos"
-)
-
-DANGER_NUMBERS_RE = re.compile(
-    r"\+DangerNumbers"
-)
-
-AFFIX_ID_RE = re.compile(
-    r"\+Id\s*\[(\d+)\]"
-)
-
-DESCRIPTION_RE = re.compile(
-    r"\+Description\s*\[(.*?)\]"
-)
-
-AFFIX_LIST_END_RE = re.compile(
-    r"OnEnterAreaEnd\(\)"
-)
+# Every line this parser reacts to carries one of these; the rest are no-ops
+STAGE_AFFIX_TOKENS = ("EnterLevel(", "AffixInfos", "OnEnterAreaEnd()", "+DangerNumbers", "+Id", "+Description")
 
 
+@register_parser
 class StageAffixParser(ParserBase):
     __PARSER__ = {
         "name": "StageAffixParser",
         "version": "0.0.1",
         "description": "Parses stage modifiers and affixes"
     }
+    __TOKENS__ = STAGE_AFFIX_TOKENS
     """
     Detects map affix lists:
     - Start: "AffixInfos"
@@ -61,33 +49,29 @@ class StageAffixParser(ParserBase):
         self._current_affix_id: Optional[int] = None
         self._current_description: Optional[str] = None
 
-    async def feed_line(self, line: str) -> None:
+    def feed_line(self, line: str) -> None:
+        m = STAGE_AFFIX_RE.search(line)
+        if not m:
+            return
+        kind = m.lastgroup
+
         # Level ID detection
-        m_level = ENTER_LEVEL_RE.search(line)
-        if m_level:
-            self._current_level_id = int(m_level.group(1))
-
-        # Detect timestamp
-        ts = None
-        m_ts = TIMESTAMP_RE.search(line)
-        if m_ts:
-            date_str, time_str, ms_str = m_ts.groups()
-            ts = datetime.strptime(
-                f"{date_str} {time_str}.{ms_str}",
-                "%Y.%m.%d %H.%M.%S.%f"
-            )
+        if kind == "enter":
+            self._current_level_id = int(m.group("level_id"))
+            return
 
         # Start collecting affixes (AffixInfos)
-        if AFFIX_LIST_START_RE.search(line):
+        if kind == "start":
             self._collecting_affixes = True
             self._pending_affixes = []
-            self._block_timestamp = ts
+            # Only block starts need the timestamp, so other lines skip parsing it
+            self._block_timestamp = parse_line_ts(line)
             self._current_affix_id = None
             self._current_description = None
             return
 
         # End of affix collection (OnEnterAreaEnd)
-        if AFFIX_LIST_END_RE.search(line):
+        if kind == "end":
             if self._collecting_affixes:
                 # Save last affix if exists
                 if self._current_affix_id is not None:
@@ -105,7 +89,7 @@ class StageAffixParser(ParserBase):
                         level_id=self._current_level_id,
                         affixes=self._pending_affixes.copy()
                     )
-                    await self._emit(model)
+                    self._emit(model)
 
                 # Reset state
                 self._collecting_affixes = False
@@ -120,7 +104,7 @@ class StageAffixParser(ParserBase):
             return
 
         # New affix block (+DangerNumbers)
-        if DANGER_NUMBERS_RE.search(line):
+        if kind == "danger":
             # Save previous affix if exists
             if self._current_affix_id is not None:
                 self._pending_affixes.append(
@@ -135,13 +119,10 @@ class StageAffixParser(ParserBase):
             return
 
         # Collect Description
-        m_desc = DESCRIPTION_RE.search(line)
-        if m_desc:
-            self._current_description = m_desc.group(1)
+        if kind == "desc":
+            self._current_description = m.group("description")
             return
 
         # Collect ID
-        m_id = AFFIX_ID_RE.search(line)
-        if m_id:
-            self._current_affix_id = int(m_id.group(1))
-            return
+        if kind == "id":
+            self._current_affix_id = int(m.group("affix_id"))
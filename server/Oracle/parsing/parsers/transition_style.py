@@ -1,10 +1,10 @@
 import re
-import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
+import sys
+from typing import Optional
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.transition_style import TransitionStyleEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log line:
@@ -14,41 +14,35 @@ TRANSITION_STYLE_RE = re.compile(
     r"GameLog: Display: \[Game\] TransitionMgr@ShowTransition TransitionStyle = (\S+)"
 )
 
+TRANSITION_STYLE_TOKEN = "TransitionMgr@ShowTransition"
 
-class TransitionStyleParser(ParserBase):
+
+@register_parser
+class TransitionStyleParser(LineParser):
     __PARSER__ = {
         "name": "TransitionStyleParser",
         "version": "0.0.1",
         "description": "Parses screen transition style events"
     }
+    __TOKENS__ = (TRANSITION_STYLE_TOKEN,)
     """
     Parser for screen transition style events.
     Emits TransitionStyleEvent when a screen transition is shown.
     """
 
     def __init__(self):
-        self._queue: list[TransitionStyleEvent] = []
-        self._event = asyncio.Event()
+        super().__init__()
 
-    async def feed_line(self, line: str):
-        m = TRANSITION_STYLE_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[TransitionStyleEvent]:
+        if TRANSITION_STYLE_TOKEN not in line:
+            return None
 
-        ts_str, transition_style = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = TRANSITION_STYLE_RE.match(line)
+        if not m:
+            return None
 
-        event = TransitionStyleEvent(
-            timestamp=timestamp,
-            transition_style=transition_style.strip()
+        return TransitionStyleEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            # A handful of style names repeat for every transition; share one string each
+            transition_style=sys.intern(m.group(2))
         )
-
-        self._queue.append(event)
-        self._event.set()
-
-    async def results(self) -> AsyncGenerator[TransitionStyleEvent, None]:
-        while True:
-            await self._event.wait()
-            while self._queue:
-                yield self._queue.pop(0)
-            self._event.clear()
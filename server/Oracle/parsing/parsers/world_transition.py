@@ -1,10 +1,10 @@
 import re
-import asyncio
-from datetime import datetime
-from typing import AsyncGenerator
 
-from Oracle.parsing.parsers.parser_base import ParserBase
+from typing import Optional
+
+from Oracle.parsing.parsers.parser_base import LineParser, register_parser
 from Oracle.parsing.parsers.events.world_transition import WorldTransitionEvent
+from Oracle.parsing.utils.timestamps import parse_log_ts
 
 
 # Example log lines:
@@ -15,42 +15,35 @@ WORLD_TRANSITION_RE = re.compile(
     r"GameLog: Display: \[Game\] PageApplyBase@ BackFlow(\d+) IsSwitchingSubWorldToMainWorld = (true|false)"
 )
 
+WORLD_TRANSITION_TOKEN = "IsSwitchingSubWorldToMainWorld"
+
 
-class WorldTransitionParser(ParserBase):
+@register_parser
+class WorldTransitionParser(LineParser):
     __PARSER__ = {
         "name": "WorldTransitionParser",
         "version": "0.0.1",
         "description": "Parses world/zone transition events"
     }
+    __TOKENS__ = (WORLD_TRANSITION_TOKEN,)
     """
     Parser for world transition events (BackFlow).
     Emits WorldTransitionEvent when switching between SubWorld and MainWorld.
     """
 
     def __init__(self):
-        self._queue: list[WorldTransitionEvent] = []
-        self._event = asyncio.Event()
+        super().__init__()
 
-    async def feed_line(self, line: str):
-        m = WORLD_TRANSITION_RE.search(line)
-        if not m:
-            return
+    def _parse_line(self, line: str) -> Optional[WorldTransitionEvent]:
+        if WORLD_TRANSITION_TOKEN not in line:
+            return None
 
-        ts_str, back_flow_step_str, is_switching_str = m.groups()
-        timestamp = datetime.strptime(ts_str, "%Y.%m.%d-%H.%M.%S")
+        m = WORLD_TRANSITION_RE.match(line)
+        if not m:
+            return None
 
-        event = WorldTransitionEvent(
-            timestamp=timestamp,
-            back_flow_step=int(back_flow_step_str),
-            is_switching_to_main_world=is_switching_str == "true"
+        return WorldTransitionEvent(
+            timestamp=parse_log_ts(m.group(1)),
+            back_flow_step=int(m.group(2)),
+            is_switching_to_main_world=m.group(3) == "true"
         )
-
-        self._queue.append(event)
-        self._event.set()
-
-    async def results(self) -> AsyncGenerator[WorldTransitionEvent, None]:
-        while True:
-            await self._event.wait()
-            while self._queue:
-                yield self._queue.pop(0)
-            self._event.clear()
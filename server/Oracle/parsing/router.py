@@ -4,9 +4,11 @@ import asyncio
 import importlib
 import os
 import pkgutil
+import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Pattern
 
 from Oracle.parsing.parsers.parser_base import ParserBase
 from Oracle.parsing.parsers.events import ParserEvent
@@ -29,8 +31,8 @@ class Router(SingletonMixin):
 
     def __init__(self, event_bus: EventBus):
         self.parsers: List[ParserBase] = []
+        # Parser drainers put, the publisher gets; the queue itself wakes the getter
         self.queue: asyncio.Queue[ParserEvent] = asyncio.Queue(maxsize=1000)
-        self._condition = asyncio.Condition()
         self._event_bus = event_bus
         
         # Check if parser logging is enabled
@@ -45,6 +47,9 @@ class Router(SingletonMixin):
         self._current_log_file: Optional[Path] = None
         self._file_size = 0
         self._event_log_file = None
+        # Event log timestamps: "YYYY-MM-DD HH:MM:SS" is rebuilt once per second
+        self._ts_sec = -1
+        self._ts_prefix = ""
         
         if self._parser_logging_enabled:
             self._log_dir.mkdir(parents=True, exist_ok=True)
@@ -70,20 +75,19 @@ class Router(SingletonMixin):
         """Background task: publish events from queue to EventBus."""
         try:
             while True:
-                async with self._condition:
-                    await self._condition.wait()
+                event = await self.queue.get()
                 
-                while not self.queue.empty():
-                    event = await self.queue.get()
-                    
-                    # Log event to file if enabled
-                    if self._parser_logging_enabled:
-                        parser_name = event.__class__.__module__.split('.')[-1]
-                        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                        log_line = f"[{timestamp}] [{parser_name}] - {event.__class__.__name__} - {event}\n"
-                        self._write_event_log(log_line)
-                    
-                    await self._event_bus.publish(event)
+                # Log event to file if enabled
+                if self._parser_logging_enabled:
+                    parser_name = event.__class__.__module__.split('.')[-1]
+                    timestamp = self._log_timestamp()
+                    log_line = f"[{timestamp}] [{parser_name}] - {event.__class__.__name__} - {event}\n"
+                    self._write_event_log(log_line)
+                    # Flush once a burst has been written out, not per event
+                    if self.queue.empty():
+                        self._flush_event_log()
+                
+                await self._event_bus.publish(event)
         except Exception as e:
             logger.error(f"❌ _publish_events crashed: {e}")
             logger.trace(e)
@@ -103,7 +107,8 @@ class Router(SingletonMixin):
         timestamp = datetime.now().strftime("%d_%m_%y_%H_%M_%S")
         self._current_log_file = self._log_dir / f"Oracle_Parser_{timestamp}.log"
         self._file_size = 0
-        self._event_log_file = open(self._current_log_file, 'a', encoding='utf-8')
+        # Block-buffered; _publish_events flushes whenever the queue runs dry
+        self._event_log_file = open(self._current_log_file, 'a', encoding='utf-8', buffering=64 * 1024)
         
         # Clean up old log files
         log_files = sorted(self._log_dir.glob("Oracle_Parser_*.log"))
@@ -114,12 +119,27 @@ class Router(SingletonMixin):
                 except Exception:
                     pass
     
+    def _log_timestamp(self) -> str:
+        """Local time as "YYYY-MM-DD HH:MM:SS.mmm" for event log lines."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = datetime.fromtimestamp(sec).strftime('%Y-%m-%d %H:%M:%S')
+        return f"{self._ts_prefix}.{int((now - sec) * 1000):03d}"
+
+    def _flush_event_log(self):
+        """Push buffered event log lines to the file and resync the byte count."""
+        if self._event_log_file:
+            self._event_log_file.flush()
+            self._file_size = os.fstat(self._event_log_file.fileno()).st_size
+
     def _write_event_log(self, log_line: str):
         """Write event log line and check for rotation."""
         if self._event_log_file:
             self._event_log_file.write(log_line)
-            self._event_log_file.flush()
-            self._file_size += len(log_line.encode('utf-8'))
+            # Character count; exact for ASCII, corrected by _flush_event_log()
+            self._file_size += len(log_line)
             
             # Check if rotation needed
             if self._file_size >= self._max_file_size:
@@ -142,15 +162,76 @@ class Router(SingletonMixin):
                 logger.trace(e)
         
         logger.info(f"✅ Loaded {len(self.parsers)} parsers")
+        self._build_dispatch()
+
+    def _build_dispatch(self) -> None:
+        """Index parsers by their __TOKENS__ so a line only reaches parsers that can match it."""
+        self._by_token: Dict[str, List[ParserBase]] = {}
+        for p in self.parsers:
+            for token in p.__TOKENS__:
+                self._by_token.setdefault(token, []).append(p)
+        
+        # One scan for all tokens rules out most lines; hits are confirmed per token.
+        # Plain re is fine here: the branches are escaped literals, so there is no
+        # backtracking, and a trie-factored pattern measured no faster.
+        self._token_re: Optional[Pattern[str]] = (
+            re.compile("|".join(re.escape(t) for t in self._by_token)) if self._by_token else None
+        )
+        self._untargeted: List[ParserBase] = [p for p in self.parsers if not p.__TOKENS__]
+
+    def _parsers_for(self, line: str) -> List[ParserBase]:
+        """Parsers that should see this line, in load order."""
+        if self._token_re is None or not self._token_re.search(line):
+            return self._untargeted
+        matched = {p for token, parsers in self._by_token.items() if token in line for p in parsers}
+        return [p for p in self.parsers if p in matched or not p.__TOKENS__]
 
-    async def feed_line(self, line: str) -> None:
+    def feed_line(self, line: str) -> None:
         """
-        Feed a log line to every parser.
+        Feed a log line to every parser interested in it.
         Parsers run independently — one failing does not affect the rest.
         """
+        for p in self._parsers_for(line):
+            try:
+                p.feed_line(line)
+            except Exception as e:
+                logger.error(f"Parser {p.__class__.__name__}: {e}")
+                logger.trace(e)
+
+    async def feed_lines(self, lines: List[str]) -> None:
+        """
+        Feed a batch of log lines to every parser, in load order.
+        Parsers with __TOKENS__ only get the lines containing one of them.
+        Parsers without tokens read the whole batch, so the loop gets a turn before
+        each of them: a large burst then holds the loop for one such parser at a
+        time, not for all of them back to back.
+        Parsers log and skip a line they fail on, so one bad line costs only that
+        line, in that parser; the rest of the batch and other parsers are unaffected.
+        """
+        targeted: Dict[ParserBase, List[str]] = {}
+        if self._token_re is not None:
+            for line in lines:
+                if not self._token_re.search(line):
+                    continue
+                for token, parsers in self._by_token.items():
+                    if token in line:
+                        for p in parsers:
+                            selected = targeted.setdefault(p, [])
+                            if not selected or selected[-1] is not line:
+                                selected.append(line)
+        
         for p in self.parsers:
+            if p.__TOKENS__:
+                batch = targeted.get(p)
+                if not batch:
+                    continue
+            else:
+                batch = lines
+                await asyncio.sleep(0)
+            # feed_lines() isolates failing lines itself; this only catches errors
+            # outside the per-line loop, so one parser cannot stop the others
             try:
-                await p.feed_line(line)
+                p.feed_lines(batch)
             except Exception as e:
                 logger.error(f"Parser {p.__class__.__name__}: {e}")
                 logger.trace(e)
@@ -158,13 +239,12 @@ class Router(SingletonMixin):
     async def _drain_parser(self, parser: ParserBase) -> None:
         """
         Background task: listen to parser results stream.
-        Each yielded ModelBase → queued and notifies consumers.
+        Each burst of events → queued; the queue wakes the publisher itself.
         """
         try:
-            async for event in parser.results():
-                await self.queue.put(event)  # Put without holding the lock
-                async with self._condition:
-                    self._condition.notify()
+            async for batch in parser.results_batch():
+                for event in batch:
+                    await self.queue.put(event)
         except Exception as e:
             logger.error(f"❌ _drain_parser error for {parser.__class__.__name__}: {e}")
             logger.trace(e)
@@ -206,8 +286,4 @@ class Router(SingletonMixin):
         Suitable for WebSocket broadcast pipeline.
         """
         while True:
-            async with self._condition:
-                await self._condition.wait()
-
-                while not self.queue.empty():
-                    yield await self.queue.get()
+            yield await self.queue.get()
@@ -0,0 +1,139 @@
+"""
+File change notifications for the log readers, via watchdog (inotify / kqueue /
+ReadDirectoryChangesW on the file's directory), with plain polling as fallback.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Dict, Optional
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
+
+from Oracle.tooling.logger import Logger
+
+logger = Logger("FileWatcher")
+
+# One observer thread serves every FileWatcher: the first watch starts it, the
+# last one to go stops it. Watchers of the same directory share its watch (and
+# emitter), so each directory's watch is counted separately.
+_observer: Optional[Observer] = None
+_watch_users: Dict[ObservedWatch, int] = {}
+_observer_lock = threading.Lock()
+
+
+def _add_watch(handler: FileSystemEventHandler, directory: str) -> ObservedWatch:
+    """Route events for directory to handler through the shared observer."""
+    global _observer
+    with _observer_lock:
+        if _observer is None:
+            observer = Observer()
+            observer.start()
+            _observer = observer
+        try:
+            watch = _observer.schedule(handler, directory, recursive=False)
+        except Exception:
+            if not _watch_users:
+                _observer.stop()
+                _observer = None
+            raise
+        _watch_users[watch] = _watch_users.get(watch, 0) + 1
+        return watch
+
+
+def _remove_watch(handler: FileSystemEventHandler, watch: ObservedWatch) -> None:
+    """Undo _add_watch; stops the shared observer once nothing is watched."""
+    global _observer
+    with _observer_lock:
+        observer = _observer
+        if observer is None or watch not in _watch_users:
+            return
+        users = _watch_users.pop(watch) - 1
+        if users:
+            _watch_users[watch] = users
+            observer.remove_handler_for_watch(handler, watch)
+            return
+        if _watch_users:
+            observer.unschedule(watch)
+            return
+        _observer = None
+    observer.stop()
+    observer.join(timeout=1.0)
+
+
+class LogChangeHandler(FileSystemEventHandler):
+    """Wakes a reader when the watched file is written, created or moved."""
+
+    def __init__(self, path: str, loop: asyncio.AbstractEventLoop, changed: asyncio.Event):
+        self._path = os.path.normcase(os.path.abspath(path))
+        self._loop = loop
+        self._changed = changed
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        # Runs on the observer thread; only hand the wake-up over to the loop
+        for p in (event.src_path, getattr(event, "dest_path", "")):
+            if p and os.path.normcase(os.path.abspath(p)) == self._path:
+                self._loop.call_soon_threadsafe(self._changed.set)
+                return
+
+
+class FileWatcher:
+    """
+    Lets a reader sleep until the OS reports a change to one file.
+    Falls back to polling every poll_interval if the observer cannot start.
+    """
+
+    def __init__(self, path: str, poll_interval: float, idle_interval: float):
+        """
+        Args:
+            path: File to watch
+            poll_interval: Polling interval in seconds when notifications are unavailable
+            idle_interval: Re-check interval without notifications, in case the OS drops or
+                delays one (appends by a process holding the file open are not always
+                reported on Windows)
+        """
+        self.path = path
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self._changed = asyncio.Event()
+        self._handler: Optional[LogChangeHandler] = None
+        self._watch: Optional[ObservedWatch] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether notifications are being delivered (False means polling)."""
+        return self._watch is not None
+
+    def start(self) -> None:
+        """Start watching the file's directory. Must run on the reader's event loop."""
+        handler = LogChangeHandler(self.path, asyncio.get_running_loop(), self._changed)
+        try:
+            self._watch = _add_watch(handler, os.path.dirname(os.path.abspath(self.path)) or ".")
+        except Exception as e:
+            logger.warning(f"File notifications unavailable, polling every {self.poll_interval}s: {e}")
+            return
+        self._handler = handler
+
+    def stop(self) -> None:
+        if self._watch is None:
+            return
+        _remove_watch(self._handler, self._watch)
+        self._watch = None
+        self._handler = None
+
+    def wake(self) -> None:
+        """End the current wait() early."""
+        self._changed.set()
+
+    async def wait(self) -> None:
+        """Sleep until the file changes (or the fallback interval passes)."""
+        if self._watch is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=self.idle_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
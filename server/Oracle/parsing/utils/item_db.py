@@ -1,8 +1,23 @@
 import json
-from typing import Dict, Mapping, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 from Oracle.tooling.paths import get_config_path
 
-ITEM_DB: Dict[str, Dict[str, Optional[str]]] = {}
+# int item id -> {"name": ..., "type": ...}; keyed by int so lookups need no str()
+ITEM_DB: Dict[int, Dict[str, Optional[str]]] = {}
+
+# Shared read-only result for unknown ids, instead of a fresh dict per miss
+_UNKNOWN_ITEM: Mapping[str, Optional[str]] = MappingProxyType({"name": None, "type": None})
+
+# ITEM_DB as int id -> (name, type), for hot paths that need both fields.
+# Always updated in place, so a bound ITEM_TUPLE.get stays valid across reloads.
+ITEM_TUPLE: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+
+
+def _rebuild_item_tuple():
+    """Refill ITEM_TUPLE from ITEM_DB."""
+    ITEM_TUPLE.clear()
+    ITEM_TUPLE.update({k: (v["name"], v["type"]) for k, v in ITEM_DB.items()})
 
 
 def load_items():
@@ -13,7 +28,7 @@ def load_items():
         with open(path, "r", encoding="utf-8") as f:
             price_data = json.load(f)
             ITEM_DB = {
-                str(base_id): {
+                int(base_id): {
                     "name": item_data.get("name"),
                     "type": item_data.get("category")
                 }
@@ -21,6 +36,7 @@ def load_items():
             }
     else:
         ITEM_DB = {}
+    _rebuild_item_tuple()
 
 
 async def load_items_from_db():
@@ -30,27 +46,36 @@ async def load_items_from_db():
 
     items = await Item.all()
     ITEM_DB = {
-        str(item.item_id): {
+        int(item.item_id): {
             "name": item.name,
             "type": item.category
         }
         for item in items
     }
+    _rebuild_item_tuple()
 
 
 def update_item(item_id: int, name: Optional[str] = None, category: Optional[str] = None):
     """Update a single item in the cache."""
     global ITEM_DB
-    key = str(item_id)
+    key = int(item_id)
     if key not in ITEM_DB:
         ITEM_DB[key] = {"name": None, "type": None}
     if name is not None:
         ITEM_DB[key]["name"] = name
     if category is not None:
         ITEM_DB[key]["type"] = category
+    ITEM_TUPLE[key] = (ITEM_DB[key]["name"], ITEM_DB[key]["type"])
 
 
 def item_lookup(base_id: int) -> Mapping[str, Optional[str]]:
     if not ITEM_DB:
         load_items()
-    return ITEM_DB.get(str(base_id), {"name": None, "type": None})
+    return ITEM_DB.get(base_id, _UNKNOWN_ITEM)
+
+
+def items_lookup(base_ids: Iterable[int]) -> Dict[int, Mapping[str, Optional[str]]]:
+    """Resolve many items at once; the item table is loaded at most once per call."""
+    if not ITEM_DB:
+        load_items()
+    return {base_id: ITEM_DB.get(base_id, _UNKNOWN_ITEM) for base_id in base_ids}
@@ -1,21 +1,36 @@
 import os
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional
 
+from Oracle.parsing.utils.file_watch import FileWatcher
+from Oracle.parsing.utils.notify_reader import share_delete_opener
 from Oracle.tooling.logger import Logger
 
 logger = Logger("LogReader")
 
+READ_SIZE = 64 * 1024
+
+
 class LogReader:
-    def __init__(self, path: str, start_at_end: bool = True, poll_interval: float = 0.1, wait_timeout: float = 300.0):
+    def __init__(self, path: str, start_at_end: bool = True, poll_interval: float = 0.1, wait_timeout: float = 300.0,
+                 idle_interval: float = 1.0):
         self.path = path
         self.start_at_end = start_at_end
-        self.poll_interval = poll_interval
+        self.poll_interval = poll_interval  # Used when file notifications are unavailable
         self.wait_timeout = wait_timeout  # Maximum time to wait for file (default 5 minutes)
+        # With notifications, still re-check this often in case the OS drops or delays one
+        # (appends by a process holding the file open are not always reported on Windows)
+        self.idle_interval = idle_interval
         self._pos = 0
         self._running = False
         self._last_mtime = 0.0
         self._last_size = 0
+        self._watcher = FileWatcher(path, poll_interval, idle_interval)
+        # Kept open between reads so a tick costs one stat plus the reads
+        self._fd: Optional[int] = None
+        self._ino = 0
+        # Bytes after the last newline; the rest of that line arrives with a later read
+        self._carry = b""
 
     async def __aenter__(self):
         logger.info(f"Waiting for: {self.path} (timeout: {self.wait_timeout}s)")
@@ -31,44 +46,90 @@ class LogReader:
             elapsed += wait_interval
         
         logger.info(f"File found: {self.path}")
-        self._last_mtime = os.path.getmtime(self.path)
-        size = os.path.getsize(self.path)
-        self._last_size = size
-        self._pos = size if self.start_at_end else 0
+        st = os.stat(self.path)
+        self._last_mtime = st.st_mtime
+        self._last_size = st.st_size
+        self._pos = st.st_size if self.start_at_end else 0
+        self._open_fd()
         self._running = True
+        self._watcher.start()
         logger.debug(f"Reading log @ {self._pos}")
         return self
 
     async def __aexit__(self, *exc):
         self._running = False
+        self._watcher.stop()
+        self._close_fd()
         logger.info("Closed")
 
+    def _open_fd(self) -> None:
+        """(Re)open the log and position it at self._pos."""
+        self._close_fd()
+        self._carry = b""
+        # The fd stays open between reads, so on Windows it must allow the game to
+        # rename or delete the log while we hold it
+        self._fd = share_delete_opener(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self._ino = os.fstat(self._fd).st_ino
+        os.lseek(self._fd, self._pos, os.SEEK_SET)
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _read_available(self) -> bytes:
+        """Read everything appended since the last call."""
+        chunks = []
+        while True:
+            data = os.read(self._fd, READ_SIZE)
+            if not data:
+                break
+            chunks.append(data)
+            if len(data) < READ_SIZE:
+                break
+        data = b"".join(chunks)
+        self._pos += len(data)
+        return data
+
     async def __aiter__(self) -> AsyncGenerator[str, None]:
+        async for lines in self.batches():
+            for line in lines:
+                if not self._running:  # Check before yielding
+                    return
+                yield line
+
+    async def batches(self) -> AsyncGenerator[List[str], None]:
+        """
+        Yield the complete lines found by each read as one list, so callers such as
+        Router.feed_lines() handle a burst per call instead of a line per call.
+        """
         while self._running:
             try:
                 # Check if file still exists
-                if not os.path.exists(self.path):
+                try:
+                    st = os.stat(self.path)
+                except FileNotFoundError:
                     logger.warning(f"Log file disappeared: {self.path}")
-                    await asyncio.sleep(self.poll_interval)
+                    await self._watcher.wait()
                     continue
                 
-                mtime = os.path.getmtime(self.path)
-                current_size = os.path.getsize(self.path)
+                mtime = st.st_mtime
+                current_size = st.st_size
                 should_read = False
 
                 # Detect file truncation or recreation (game restart)
-                if current_size < self._last_size:
+                if current_size < self._last_size or st.st_ino != self._ino or self._fd is None:
                     logger.debug(f"Log file truncated or recreated (size: {self._last_size} -> {current_size})")
                     self._pos = 0
                     # Wait a bit for game to finish writing initial content
                     await asyncio.sleep(0.2)
-                    # Re-check size after waiting
-                    current_size = os.path.getsize(self.path)
-                    mtime = os.path.getmtime(self.path)
-                    self._last_size = current_size
-                    self._last_mtime = mtime
+                    # The old fd may point at the replaced file, so open the path again
+                    self._open_fd()
+                    st = os.fstat(self._fd)
+                    self._last_size = st.st_size
+                    self._last_mtime = st.st_mtime
                     should_read = True  # Force read after truncation
-                    logger.info(f"Reading from start after truncation (new size: {current_size})")
+                    logger.info(f"Reading from start after truncation (new size: {st.st_size})")
 
                 # Read new content if file was modified or size changed
                 elif mtime != self._last_mtime or current_size != self._last_size:
@@ -77,18 +138,16 @@ class LogReader:
                     self._last_size = current_size
 
                 if should_read:
-                    with open(self.path, "r", encoding="utf-8", errors="ignore") as f:
-                        f.seek(self._pos)
-                        chunk = f.read()
-                        self._pos = f.tell()
-
-                    if chunk:
-                        for line in chunk.splitlines():
-                            if not self._running:  # Check before yielding
-                                return
-                            yield line.rstrip("\r\n")
-
-                await asyncio.sleep(self.poll_interval)
+                    data = self._carry + self._read_available()
+                    nl = data.rfind(b"\n")
+                    if nl >= 0:
+                        self._carry = data[nl + 1:]
+                        # splitlines() already drops the line terminators
+                        yield data[:nl + 1].decode("utf-8", errors="ignore").splitlines()
+                    else:
+                        self._carry = data
+
+                await self._watcher.wait()
 
             except asyncio.CancelledError:
                 # Task was cancelled, exit cleanly
@@ -1,71 +1,58 @@
 """
 Cross-platform file monitoring with asyncio support and aggressive polling.
-Uses ProcessPoolExecutor for non-blocking file I/O.
+Reads happen directly on the event loop: each poll only picks up the few KB
+appended since the last one, which is cheaper than a thread hand-off.
 """
 
 import asyncio
 import os
 from pathlib import Path
-from typing import AsyncIterator
-from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple
 
-from Oracle.tooling.logger import Logger
+from Oracle.parsing.utils.file_watch import FileWatcher
 
-logger = Logger("NotifyReader")
+# Last consumed bytes, read again with new data to recognise an in-place rewrite
+TAIL_SIZE = 64
 
-def _read_file_info(filepath: str, position: int) -> dict:
+# Most bytes consumed per read; a bigger backlog is read over several polls
+MAX_READ = 2 * 1024 * 1024
+
+
+def share_delete_opener(path: str, flags: int) -> int:
     """
-    Read file info and new lines, detecting truncation/rotation.
-    Runs in executor to avoid blocking event loop.
-    
-    Args:
-        filepath: Path to file
-        position: Current file position
-        
-    Returns:
-        Dict with: lines, new_position, file_size, inode, exists, truncated
+    open() opener that lets other processes rename or delete the file while we
+    hold it. POSIX allows that anyway; on Windows the game rotates its log on
+    startup, which would fail against a handle opened without FILE_SHARE_DELETE.
     """
-    result = {
-        'lines': [],
-        'new_position': position,
-        'file_size': 0,
-        'inode': None,
-        'exists': False,
-        'truncated': False
-    }
-    
-    try:
-        # Get file stats
-        stat = os.stat(filepath)
-        result['exists'] = True
-        result['file_size'] = stat.st_size
-        result['inode'] = stat.st_ino
-        
-        # Detect truncation (file size smaller than our position)
-        if stat.st_size < position:
-            result['truncated'] = True
-            position = 0  # Reset to beginning
-        
-        # Read new lines
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            f.seek(position)
-            for line in f:
-                result['lines'].append(line.rstrip('\n\r'))
-            result['new_position'] = f.tell()
-            
-    except FileNotFoundError:
-        result['exists'] = False
-    except Exception:
-        # File might be locked temporarily
-        pass
-    
-    return result
+    if os.name != "nt":
+        return os.open(path, flags)
+
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    GENERIC_READ = 0x80000000
+    FILE_SHARE_READ_WRITE_DELETE = 0x00000007
+    OPEN_EXISTING = 3
+    FILE_ATTRIBUTE_NORMAL = 0x80
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    create_file = ctypes.windll.kernel32.CreateFileW
+    create_file.restype = wintypes.HANDLE
+    handle = create_file(
+        path, GENERIC_READ, FILE_SHARE_READ_WRITE_DELETE, None,
+        OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, None
+    )
+    if handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError()
+    # No O_TEXT: the CRT descriptor stays binary, decoding is left to open()
+    return msvcrt.open_osfhandle(handle, os.O_RDONLY)
 
 
 class NotifyReader:
     """
     Asynchronous file reader with non-blocking polling.
-    Uses ThreadPoolExecutor for file I/O to avoid blocking the event loop.
+    New data is read synchronously between polls; the file stays open throughout.
     """
     
     def __init__(self, filepath: Path | str, poll_interval: float = 0.05):
@@ -77,100 +64,271 @@ class NotifyReader:
             poll_interval: Polling interval in seconds (default 50ms for low latency)
         """
         self.filepath = Path(filepath).resolve()
+        # Converted once: os.stat runs every poll and takes bytes without re-encoding
+        self._path_str = str(self.filepath)
+        self._path_bytes = os.fsencode(self._path_str)
         self.poll_interval = poll_interval
         self._position = 0
         self._last_inode = None
-        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NotifyReader")
         self._stop_event = asyncio.Event()
+        # Kept open across polls
+        # Binary, so positions are plain byte offsets; decoding happens per read.
+        # Unbuffered: every read asks for exactly the bytes appended since the last poll
+        self._fh: Optional[BinaryIO] = None
+        # Last bytes consumed from the open file, ending at byte offset _tail_pos
+        self._tail = b""
+        self._tail_pos = 0
+
+    def _open(self) -> BinaryIO:
+        """(Re)open the followed file."""
+        self._close()
+        self._fh = open(self._path_str, 'rb', buffering=0, opener=share_delete_opener)
+        self._tail = b""
+        self._tail_pos = 0
+        return self._fh
+
+    def _read_from(self, fh: BinaryIO, position: int, file_size: int) -> Optional[Tuple[bytes, int]]:
+        """
+        Read up to MAX_READ new bytes from position.
+
+        The bytes consumed just before position are read again by the same read()
+        and compared with the cached tail. A mismatch means the file was rewritten
+        in place (truncated and regrown past our position, or an inode number
+        reused by the filesystem), which size and inode can't tell.
+
+        Returns:
+            (data, start) with the new bytes at data[start:], or None if rewritten
+        """
+        tail = self._tail if self._tail_pos == position else b""
+        start = len(tail)
+        fh.seek(position - start)
+        data = fh.read(start + min(file_size - position, MAX_READ))
+        if not data.startswith(tail):
+            return None
+        return data, start
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _read_file_info(self, position: int, last_inode: Optional[int] = None) -> dict:
+        """
+        Read file info and new lines, detecting truncation/rotation.
+
+        The file stays open between calls: a poll is an fstat, plus a read when the
+        file grew. The path is only stat'ed when the open file has not grown, to
+        notice the game replacing it. A replaced file is read from the start in the
+        same call.
+
+        Args:
+            position: Current file position
+            last_inode: Inode of the file being followed, if known
+
+        Returns:
+            Dict with: lines, new_position, file_size, inode, exists, truncated, rotated,
+            capped (more complete data is waiting past new_position)
+        """
+        result = {
+            'lines': [],
+            'new_position': position,
+            'file_size': 0,
+            'inode': None,
+            'exists': False,
+            'truncated': False,
+            'rotated': False,
+            'capped': False
+        }
+
+        try:
+            fh = self._fh if self._fh is not None else self._open()
+            stat = os.fstat(fh.fileno())
+
+            # No growth: check whether the path now names a different file
+            if stat.st_size <= position:
+                if os.stat(self._path_bytes).st_ino != stat.st_ino:
+                    fh = self._open()
+                    stat = os.fstat(fh.fileno())
+
+            result['exists'] = True
+            result['file_size'] = stat.st_size
+            result['inode'] = stat.st_ino
+
+            if last_inode is not None and stat.st_ino != last_inode:
+                # Rotated (or deleted and recreated): a new file, start from beginning
+                result['rotated'] = True
+                position = 0
+            elif stat.st_size < position:
+                # Detect truncation (file size smaller than our position)
+                result['truncated'] = True
+                position = 0  # Reset to beginning
+
+            # Read new lines: one read, one decode, split in C. A trailing line the
+            # game has not finished writing is left for the next poll.
+            result['new_position'] = position
+            if stat.st_size != position:
+                read = self._read_from(fh, position, stat.st_size)
+                if read is None:
+                    # Rewritten in place: same as a truncation
+                    result['truncated'] = True
+                    position = 0
+                    result['new_position'] = 0
+                    read = self._read_from(fh, 0, stat.st_size)
+                data, start = read
+                result['capped'] = stat.st_size - position > MAX_READ
+                end = data.rfind(b'\n', start) + 1
+                if not end and len(data) - start == MAX_READ:
+                    # A single line longer than MAX_READ: pass it on in pieces
+                    end = len(data)
+                if end:
+                    result['lines'] = data[start:end].decode('utf-8', errors='replace').splitlines()
+                    result['new_position'] = position + end - start
+                    self._tail = data[max(0, end - TAIL_SIZE):end]
+                    self._tail_pos = result['new_position']
+
+        except FileNotFoundError:
+            # Reopen once the file is back
+            self._close()
+            result['exists'] = False
+        except Exception:
+            # File might be locked temporarily
+            pass
+
+        return result
         
     async def stop(self):
         """Stop following the file."""
         self._stop_event.set()
-        self._executor.shutdown(wait=False)
+
+    async def _wait(self) -> None:
+        """Pause between polls; returns right away once stop() is called."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
         
-    async def follow(self) -> AsyncIterator[str]:
+    async def follow(self) -> AsyncIterator[List[str]]:
         """
-        Follow the file and yield new lines as they are written.
-        Uses non-blocking I/O via executor.
+        Follow the file and yield the new lines found by each poll as one list,
+        so a burst costs the consumer one resume instead of one per line.
         
         Yields:
-            New lines from the file
+            Non-empty lists of new lines from the file
         """
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {self.filepath}")
         
-        loop = asyncio.get_event_loop()
-        
         try:
-            # Seek to end of file without reading existing content
-            info = await loop.run_in_executor(
-                self._executor,
-                _read_file_info,
-                str(self.filepath),
-                0
-            )
-            
-            # Start from end of file
-            self._position = info['file_size']
-            self._last_inode = info['inode']
+            # Start from end of file without reading existing content
+            stat = os.stat(self._path_bytes)
+            self._position = stat.st_size
+            self._last_inode = stat.st_ino
             
             # Poll for new content
+            capped = False
             while not self._stop_event.is_set():
-                await asyncio.sleep(self.poll_interval)
+                if capped:
+                    # Backlog left over from a capped read: go on without waiting,
+                    # only letting the rest of the loop run first
+                    capped = False
+                    await asyncio.sleep(0)
+                else:
+                    await self._wait()
+                    if self._stop_event.is_set():
+                        break
                 
-                # Read file info and new lines
-                info = await loop.run_in_executor(
-                    self._executor,
-                    _read_file_info,
-                    str(self.filepath),
-                    self._position
-                )
+                # Idle polls stop at one stat: same file, same size
+                try:
+                    stat = os.stat(self._path_bytes)
+                except FileNotFoundError:
+                    # File was deleted, wait for it to reappear
+                    continue
+                if stat.st_size == self._position and stat.st_ino == self._last_inode:
+                    continue
+                
+                # Read file info and new lines (rotation is handled in the same call)
+                info = self._read_file_info(self._position, self._last_inode)
                 
                 if not info['exists']:
                     # File was deleted, wait for it to reappear
                     continue
                 
-                # Detect file rotation (inode changed)
-                if self._last_inode and info['inode'] != self._last_inode:
-                    # File was rotated, start from beginning
-                    self._position = 0
-                    self._last_inode = info['inode']
-                    # Re-read from beginning
-                    info = await loop.run_in_executor(
-                        self._executor,
-                        _read_file_info,
-                        str(self.filepath),
-                        0
-                    )
-                elif info['truncated']:
-                    # File was truncated, position already reset in executor
+                if info['rotated'] or info['truncated']:
+                    # Position already reset by _read_file_info
                     self._last_inode = info['inode']
                 
                 # Update position
                 self._position = info['new_position']
+                capped = info['capped']
                 
                 # Yield new lines
-                for line in info['lines']:
-                    yield line
+                if info['lines']:
+                    yield info['lines']
+        finally:
+            self._close()
+
+
+class WatchdogReader(NotifyReader):
+    """
+    NotifyReader that sleeps until the OS reports a change to the file
+    (inotify / kqueue / ReadDirectoryChangesW via watchdog) instead of polling.
+    Falls back to plain polling if the observer cannot start.
+    """
+
+    def __init__(self, filepath: Path | str, poll_interval: float = 0.05, idle_interval: float = 1.0):
+        """
+        Args:
+            filepath: Path to the file to monitor
+            poll_interval: Polling interval in seconds when notifications are unavailable
+            idle_interval: Re-check interval without notifications (see FileWatcher)
+        """
+        super().__init__(filepath, poll_interval)
+        self._watcher = FileWatcher(self._path_str, poll_interval, idle_interval)
+
+    async def stop(self):
+        await super().stop()
+        # Don't sit out the rest of idle_interval
+        self._watcher.wake()
+
+    async def _wait(self) -> None:
+        """Sleep until the file changes (or the fallback interval passes)."""
+        if not self._watcher.active:
+            await super()._wait()
+            return
+        await self._watcher.wait()
+
+    async def follow(self) -> AsyncIterator[List[str]]:
+        self._watcher.start()
+        try:
+            async for lines in super().follow():
+                yield lines
         finally:
-            self._executor.shutdown(wait=False)
+            self._watcher.stop()
+
+
+def _make_reader(filepath: Path | str, poll_interval: float, watch: bool) -> NotifyReader:
+    return WatchdogReader(filepath, poll_interval) if watch else NotifyReader(filepath, poll_interval)
 
 
-async def follow_file(filepath: Path | str, poll_interval: float = 0.05) -> AsyncIterator[str]:
+async def follow_file(
+    filepath: Path | str, poll_interval: float = 0.05, watch: bool = False
+) -> AsyncIterator[List[str]]:
     """
     Convenience function to follow a file with aggressive polling.
     
     Args:
         filepath: Path to the file to monitor
         poll_interval: Polling interval in seconds (default 50ms)
+        watch: Wait for file change notifications instead of polling (WatchdogReader)
     
     Yields:
-        New lines from the file
+        Non-empty lists of new lines from the file, one per poll
     
     Example:
-        async for line in follow_file("game.log"):
-            print(f"New line: {line}")
+        async for lines in follow_file("game.log"):
+            for line in lines:
+                print(f"New line: {line}")
     """
-    reader = NotifyReader(filepath, poll_interval)
-    async for line in reader.follow():
-        yield line
+    reader = _make_reader(filepath, poll_interval, watch)
+    async for lines in reader.follow():
+        yield lines
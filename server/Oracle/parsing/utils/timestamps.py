@@ -0,0 +1,84 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+
+LOG_TS_FORMAT = "%Y.%m.%d-%H.%M.%S"
+
+# Characters allowed in the "YYYY.MM.DD-HH.MM.SS" part; str.strip() with this set
+# leaves nothing behind only if every character is one of them
+_TS_CHARS = "0123456789.-"
+
+# The "[YYYY.MM.DD-HH.MM.SS:mmm]" prefix of a game log line: date, time, milliseconds
+TIMESTAMP_RE = re.compile(
+    r"\[(\d{4}\.\d{2}\.\d{2})-(\d{2}\.\d{2}\.\d{2}):(\d{3})]"
+)
+
+
+def _fast_ts(s: str) -> datetime:
+    """Parse the fixed-width "YYYY.MM.DD-HH.MM.SS" format via datetime.fromisoformat.
+
+    The date and time halves are rewritten to ISO 8601 ("YYYY-MM-DDTHH:MM:SS")
+    with two str.replace calls, leaving the parsing itself to C.
+    Falls back to strptime for anything that isn't exactly that width.
+    """
+    if len(s) != 19:
+        return datetime.strptime(s, LOG_TS_FORMAT)
+    return datetime.fromisoformat(s[:10].replace(".", "-") + "T" + s[11:].replace(".", ":"))
+
+
+@lru_cache(maxsize=4096)
+def parse_log_ts(ts_str: str) -> datetime:
+    """Parse a game log timestamp ("2025.11.25-22.21.54").
+
+    Log lines share timestamps at one-second granularity, so results are cached.
+    """
+    return _fast_ts(ts_str)
+
+
+# Last (date, time, ms) parsed by parse_log_ts_ms and its result. Lines logged in the
+# same frame share the whole timestamp, so a burst mostly hits this single slot.
+_LAST_TS_MS: Tuple[Tuple[str, str, str], datetime] = (("", "", ""), datetime.min)
+
+
+def parse_log_ts_ms(date_str: str, time_str: str, ms_str: str) -> datetime:
+    """Parse a timestamp split as date, time and milliseconds ("2025.11.25", "22.21.54", "100").
+
+    Only the cached second-level part is parsed; milliseconds are applied on top.
+    A repeat of the previous timestamp returns the previous result directly.
+    """
+    global _LAST_TS_MS
+    key = (date_str, time_str, ms_str)
+    last = _LAST_TS_MS
+    if last[0] == key:
+        return last[1]
+    ts = parse_log_ts(f"{date_str}-{time_str}").replace(microsecond=int(ms_str) * 1000)
+    _LAST_TS_MS = (key, ts)
+    return ts
+
+
+def parse_line_ts(line: str) -> Optional[datetime]:
+    """Timestamp of a game log line from its TIMESTAMP_RE prefix, or None if it has none."""
+    m = TIMESTAMP_RE.match(line)
+    if not m:
+        return None
+    return parse_log_ts_ms(m.group(1), m.group(2), m.group(3))
+
+
+def split_log_line(line: str) -> Optional[Tuple[str, str, int]]:
+    """Split the "[YYYY.MM.DD-HH.MM.SS:mmm]" prefix off a game log line by slicing.
+
+    Returns (timestamp, milliseconds, body_start), where body_start is the index just
+    past the prefix so body patterns can be applied with ``pattern.match(line, body_start)``.
+    Returns None if the line does not start with a well-formed prefix.
+    """
+    if len(line) < 23 or line[0] != "[" or line[11] != "-" or line[20] != ":":
+        return None
+    end = line.find("]", 21)
+    if end < 0:
+        return None
+    ts_str = line[1:20]
+    ms_str = line[21:end]
+    if not ms_str.isdigit() or ts_str.strip(_TS_CHARS):
+        return None
+    return ts_str, ms_str, end + 1
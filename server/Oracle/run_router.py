@@ -15,7 +15,7 @@ async def main():
         async for message in websocket:
             print("Received:", message)
             # message is a log line from WS server
-            await router.feed_line(message)
+            router.feed_line(message)
 
             async for result in router.results():
                 print("Parsed:", result)
@@ -51,11 +51,12 @@ logger = Logger("Server")
 async def log_pipeline():
     parser_config = config.get("parser")
     log_path = parser_config["log_path"]
+    watch = parser_config.get("watch", True)
 
     try:
-        logger.info(f"📄 Starting log tail with watchdog: {log_path}")
-        async for line in follow_file(log_path):
-            await router.feed_line(line)
+        logger.info(f"📄 Starting log tail ({'watchdog' if watch else 'polling'}): {log_path}")
+        async for lines in follow_file(log_path, watch=watch):
+            await router.feed_lines(lines)
     except asyncio.CancelledError:
         logger.debug("Log pipeline cancelled")
         raise
@@ -129,6 +130,11 @@ async def lifespan(app: FastAPI):
                 await asyncio.shield(event_bus.shutdown())
             logger.debug("✓ Event bus shutdown")
             
+            # Close PriceDB HTTP session
+            logger.debug("Closing PriceDB...")
+            await asyncio.shield(price_db.close())
+            logger.debug("✓ PriceDB closed")
+            
             # Close database
             logger.debug("Closing database...")
             await asyncio.shield(close_db())
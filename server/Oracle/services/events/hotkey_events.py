@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HotkeyPressedEvent(ServiceEvent):
     """Event fired when an external hotkey tool sends a key press."""
 
@@ -15,6 +15,6 @@ class HotkeyPressedEvent(ServiceEvent):
         """Convert to dictionary for WebSocket transmission."""
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "key": self.key
         }
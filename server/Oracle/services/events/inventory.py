@@ -6,7 +6,7 @@ from Oracle.services.model import InventorySnapshot
 from Oracle.services.model.inventory_model import Inventory
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RequestInventoryEvent(ServiceEvent):
     """
     Event requesting the current inventory snapshot.
@@ -17,13 +17,13 @@ class RequestInventoryEvent(ServiceEvent):
 
     def to_dict(self) -> Dict[str, str | None]:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "type": str(self.type),
             "requester": self.requester,
         }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InventorySnapshotEvent(ServiceEvent):
     """
     Event containing a snapshot of the current inventory.
@@ -34,7 +34,7 @@ class InventorySnapshotEvent(ServiceEvent):
 
     def to_dict(self) -> dict:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "type": str(self.type),
             "snapshot": {
                 "timestamp": self.snapshot.timestamp.isoformat(),
@@ -43,10 +43,10 @@ class InventorySnapshotEvent(ServiceEvent):
         }
 
     def __repr__(self) -> str:
-        return f"<InventorySnapshotEvent {self.snapshot} @ {self.timestamp.isoformat()}>"
+        return f"<InventorySnapshotEvent {self.snapshot} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InventoryUpdateEvent(ServiceEvent):
     """
     Event to update entire inventory state.
@@ -57,10 +57,10 @@ class InventoryUpdateEvent(ServiceEvent):
     
     def to_dict(self) -> dict:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "type": str(self.type),
             "inventory": self.inventory.to_dict(),
         }
     
     def __repr__(self) -> str:
-        return f"<InventoryUpdateEvent {self.inventory} @ {self.timestamp.isoformat()}>"
+        return f"<InventoryUpdateEvent {self.inventory} @ {self.timestamp_dt.isoformat()}>"
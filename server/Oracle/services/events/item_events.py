@@ -6,7 +6,7 @@ from typing import Optional
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemDataChangedEvent(ServiceEvent):
     """Event published when item data is changed via API."""
     item_id: int
@@ -21,7 +21,9 @@ class ItemDataChangedEvent(ServiceEvent):
         category: Optional[str] = None,
         price: float = 0.0
     ):
-        super().__init__(
+        # Explicit base call: zero-arg super() does not work in slotted dataclasses
+        ServiceEvent.__init__(
+            self,
             timestamp=datetime.now(),
             type=ServiceEventType.ITEM_DATA_CHANGED
         )
@@ -31,7 +33,7 @@ class ItemDataChangedEvent(ServiceEvent):
         self.price = price
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ItemObtainedEvent(ServiceEvent):
     """Event published when an item is obtained/lost during gameplay."""
     item_id: int
@@ -43,4 +45,4 @@ class ItemObtainedEvent(ServiceEvent):
 
     def __repr__(self) -> str:
         action = "gained" if self.delta > 0 else "lost"
-        return f"<ItemObtainedEvent {self.item_name or self.item_id} {action} {abs(self.delta)} (value: {self.total_value:.2f}) @ {self.timestamp.isoformat()}>"
+        return f"<ItemObtainedEvent {self.item_name or self.item_id} {action} {abs(self.delta)} (value: {self.total_value:.2f}) @ {self.timestamp_dt.isoformat()}>"
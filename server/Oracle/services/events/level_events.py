@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LevelProgressEvent(ServiceEvent):
     """Event containing character level progress information."""
     level: int  # Current character level
@@ -7,7 +7,7 @@ from Oracle.services.model import InventoryItem
 from Oracle.services.model.inventory_model import Inventory
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapStartedEvent(ServiceEvent):
     """Event emitted when a map is started."""
     level_id: int
@@ -21,10 +21,10 @@ class MapStartedEvent(ServiceEvent):
     def __repr__(self) -> str:
         map_info = f"{self.map.name} [{self.map.difficulty}]" if self.map else f"ID:{self.level_id}"
         inv_count = len(self.inventory) if self.inventory else 0
-        return f"<MapStartedEvent {map_info} uid={self.level_uid} type={self.level_type} inventory={inv_count} items @ {self.timestamp.isoformat()}>"
+        return f"<MapStartedEvent {map_info} uid={self.level_uid} type={self.level_type} inventory={inv_count} items @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapFinishedEvent(ServiceEvent):
     """Event emitted when a map is finished."""
     duration: float  # Duration in seconds
@@ -36,10 +36,10 @@ class MapFinishedEvent(ServiceEvent):
     def __repr__(self) -> str:
         total_changes = sum(abs(v) for v in self.inventory_changes.values())
         map_info = f"{self.map.name} [{self.map.difficulty}]" if self.map else "Unknown"
-        return f"<MapFinishedEvent {map_info} duration={self.duration:.2f}s changes={total_changes} items @ {self.timestamp.isoformat()}>"
+        return f"<MapFinishedEvent {map_info} duration={self.duration:.2f}s changes={total_changes} items @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapStatsEvent(ServiceEvent):
     """Event emitted with statistics for a completed map."""
     duration: float  # Duration in seconds
@@ -50,10 +50,10 @@ class MapStatsEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.MAP_STATS
     
     def __repr__(self) -> str:
-        return f"<MapStatsEvent duration={self.duration:.2f}s currency={self.currency_gained:.2f} exp={self.exp_gained:.0f} @ {self.timestamp.isoformat()}>"
+        return f"<MapStatsEvent duration={self.duration:.2f}s currency={self.currency_gained:.2f} exp={self.exp_gained:.0f} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapStatusEvent(ServiceEvent):
     """Event sent to newly connected clients with current map state (does not trigger stats recalculation)."""
     level_id: int
@@ -66,10 +66,10 @@ class MapStatusEvent(ServiceEvent):
 
     def __repr__(self) -> str:
         map_info = f"{self.map.name} [{self.map.difficulty}]" if self.map else f"ID:{self.level_id}"
-        return f"<MapStatusEvent {map_info} uid={self.level_uid} @ {self.timestamp.isoformat()}>"
+        return f"<MapStatusEvent {map_info} uid={self.level_uid} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MapRecordEvent(ServiceEvent):
     """Event fired when a map completion is recorded in the database."""
     map_record: Dict[str, str]  # Serialized MapCompletion model (as returned by GET /maps/{id})
@@ -78,4 +78,4 @@ class MapRecordEvent(ServiceEvent):
     def __repr__(self) -> str:
         map_id = self.map_record.get('id', 'unknown')
         player = self.map_record.get('player_name', 'unknown')
-        return f"<MapRecordEvent id={map_id} player={player} @ {self.timestamp.isoformat()}>"
+        return f"<MapRecordEvent id={map_id} player={player} @ {self.timestamp_dt.isoformat()}>"
@@ -12,7 +12,7 @@ class MarketAction(str, Enum):
     OPEN = "market_open"
     CLOSE = "market_close"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarketActionEvent(ServiceEvent):
     """Event published when the market is opened or closed."""
     
@@ -20,10 +20,10 @@ class MarketActionEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.MARKET_ACTION    
     
     def __repr__(self) -> str:
-        return f"<MarketActionEvent action={self.action.value} @ {self.timestamp.isoformat()}>"
+        return f"<MarketActionEvent action={self.action.value} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarketTransactionEvent(ServiceEvent):
     """Event published when an item transaction occurs in the market."""
     
@@ -35,4 +35,4 @@ class MarketTransactionEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.MARKET_TRANSACTION
     
     def __repr__(self) -> str:
-        return f"<MarketTransactionEvent item={self.item_id} qty={self.quantity} action={self.action} tx_id={self.transaction_id} @ {self.timestamp.isoformat()}>"
+        return f"<MarketTransactionEvent item={self.item_id} qty={self.quantity} action={self.action} tx_id={self.transaction_id} @ {self.timestamp_dt.isoformat()}>"
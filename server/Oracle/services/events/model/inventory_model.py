@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """Represents a single item in an inventory slot."""
     item_id: int
@@ -14,7 +14,7 @@ class InventoryItem:
     category: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InventorySnapshot:
     """Snapshot of inventory state at a specific time."""
     timestamp: datetime
@@ -15,7 +15,7 @@ class NotificationSeverity(str, Enum):
     ERROR = "error"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NotificationEvent(ServiceEvent):
     """Event for broadcasting notifications to UI clients."""
     
@@ -29,7 +29,7 @@ class NotificationEvent(ServiceEvent):
         """Convert to dictionary for WebSocket transmission."""
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "title": self.title,
             "content": self.content,
             "severity": self.severity.value,
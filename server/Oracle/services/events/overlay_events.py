@@ -5,7 +5,7 @@ from typing import List, Dict, Any, Optional
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OverlayBoundsUpdateEvent(ServiceEvent):
     """Event containing all dialog bounding boxes from the overlay."""
     bounds: List[Dict[str, Any]] = field(default_factory=list)
@@ -14,12 +14,12 @@ class OverlayBoundsUpdateEvent(ServiceEvent):
     def to_dict(self):
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "bounds": self.bounds
         }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HoverEnterEvent(ServiceEvent):
     """Event fired when mouse enters a dialog bounding box."""
     type: ServiceEventType = ServiceEventType.HOVER_ENTER
@@ -27,11 +27,11 @@ class HoverEnterEvent(ServiceEvent):
     def to_dict(self):
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp_dt.isoformat()
         }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HoverLeaveEvent(ServiceEvent):
     """Event fired when mouse leaves all dialog bounding boxes."""
     type: ServiceEventType = ServiceEventType.HOVER_LEAVE
@@ -39,11 +39,11 @@ class HoverLeaveEvent(ServiceEvent):
     def to_dict(self):
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp_dt.isoformat()
         }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OverlayInfoTextEvent(ServiceEvent):
     """Info text message displayed on the overlay."""
     text: str = ""
@@ -54,7 +54,7 @@ class OverlayInfoTextEvent(ServiceEvent):
     def to_dict(self):
         d = {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "text": self.text,
             "severity": self.severity,
         }
@@ -63,7 +63,7 @@ class OverlayInfoTextEvent(ServiceEvent):
         return d
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ViewChangedEvent(ServiceEvent):
     """Broadcast when the game view changes (e.g. FightCtrl, AuctionHouse)."""
     view: str = ""
@@ -72,6 +72,6 @@ class ViewChangedEvent(ServiceEvent):
     def to_dict(self):
         return {
             "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "view": self.view,
         }
@@ -1,10 +1,9 @@
 from dataclasses import dataclass
-from enum import Enum
 
-from Oracle.events.base_event import Event
+from Oracle.events.base_event import Event, EventEnum
 
 
-class ServiceEventType(str, Enum):
+class ServiceEventType(EventEnum):
     """Event type enum that can be used as ServiceEventType.VALUE and converts to lowercase string."""
     NONE = "none" 
     CLIENT_CONNECTED = "client_connected"
@@ -44,11 +43,8 @@ class ServiceEventType(str, Enum):
     OVERLAY_INFO_TEXT = "overlay_info_text"
     VIEW_CHANGED = "view_changed"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-@dataclass
+@dataclass(slots=True)
 class ServiceEvent(Event[ServiceEventType]):
     """Base class for all service events."""
     pass
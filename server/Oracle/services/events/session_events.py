@@ -1,22 +1,19 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
 from typing import Optional
 
+from Oracle.events.base_event import EventEnum
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-class SessionControlAction(str, Enum):
+class SessionControlAction(EventEnum):
     """Actions for controlling session tracking."""
     START = "start"
     CLOSE = "close"
     NEXT = "next"  # Close current session and start new one atomically
-    
-    def __str__(self) -> str:
-        return self.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionControlEvent(ServiceEvent):
     """Event to control session tracking."""
     action: SessionControlAction
@@ -24,10 +21,10 @@ class SessionControlEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.SESSION_CONTROL
     
     def __repr__(self) -> str:
-        return f"<SessionControlEvent action={self.action} player={self.player_name} @ {self.timestamp.isoformat()}>"
+        return f"<SessionControlEvent action={self.action} player={self.player_name} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PlayerChangedEvent(ServiceEvent):
     """Event fired when the current player changes."""
     old_player: Optional[str]  # None for first player on init
@@ -35,10 +32,10 @@ class PlayerChangedEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.PLAYER_CHANGED
     
     def __repr__(self) -> str:
-        return f"<PlayerChangedEvent old={self.old_player} new={self.new_player} @ {self.timestamp.isoformat()}>"
+        return f"<PlayerChangedEvent old={self.old_player} new={self.new_player} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionStartedEvent(ServiceEvent):
     """Event fired when a farming session is started."""
     session_id: int
@@ -48,10 +45,10 @@ class SessionStartedEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.SESSION_STARTED
 
     def __repr__(self) -> str:
-        return f"<SessionStartedEvent session_id={self.session_id} player={self.player_name} @ {self.timestamp.isoformat()}>"
+        return f"<SessionStartedEvent session_id={self.session_id} player={self.player_name} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionFinishedEvent(ServiceEvent):
     """Event fired when a farming session is finished."""
     session_id: int
@@ -66,10 +63,10 @@ class SessionFinishedEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.SESSION_FINISHED
 
     def __repr__(self) -> str:
-        return f"<SessionFinishedEvent session_id={self.session_id} player={self.player_name} maps={self.total_maps} @ {self.timestamp.isoformat()}>"
+        return f"<SessionFinishedEvent session_id={self.session_id} player={self.player_name} maps={self.total_maps} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionSnapshotEvent(ServiceEvent):
     """Event fired in response to REQUEST_SESSION with current session data."""
     session_id: int = None
@@ -79,10 +76,10 @@ class SessionSnapshotEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.SESSION_SNAPSHOT
 
     def __repr__(self) -> str:
-        return f"<SessionSnapshotEvent session_id={self.session_id} player={self.player_name} active={self.is_active} @ {self.timestamp.isoformat()}>"
+        return f"<SessionSnapshotEvent session_id={self.session_id} player={self.player_name} active={self.is_active} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionRestoreEvent(ServiceEvent):
     """Event fired when restoring session stats from database."""
     session_id: int
@@ -100,4 +97,4 @@ class SessionRestoreEvent(ServiceEvent):
     type: ServiceEventType = ServiceEventType.SESSION_RESTORE
 
     def __repr__(self) -> str:
-        return f"<SessionRestoreEvent session_id={self.session_id} player={self.player_name} maps={self.total_maps} @ {self.timestamp.isoformat()}>"
+        return f"<SessionRestoreEvent session_id={self.session_id} player={self.player_name} maps={self.total_maps} @ {self.timestamp_dt.isoformat()}>"
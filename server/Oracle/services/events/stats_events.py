@@ -1,32 +1,29 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
 from typing import Dict
 
+from Oracle.events.base_event import EventEnum
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-class StatsControlAction(str, Enum):
+class StatsControlAction(EventEnum):
     """Actions for controlling stats tracking."""
     START = "start"
     STOP = "stop"
     RESTART = "restart"
-    
-    def __str__(self) -> str:
-        return self.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StatsControlEvent(ServiceEvent):
     """Event to control stats tracking."""
     action: StatsControlAction
     type: ServiceEventType = ServiceEventType.STATS_CONTROL
     
     def __repr__(self) -> str:
-        return f"<StatsControlEvent action={self.action} @ {self.timestamp.isoformat()}>"
+        return f"<StatsControlEvent action={self.action} @ {self.timestamp_dt.isoformat()}>"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StatsUpdateEvent(ServiceEvent):
     """Event containing current statistics."""
     total_maps: int
@@ -55,5 +52,5 @@ class StatsUpdateEvent(ServiceEvent):
             f"exp_rate={self.exp_per_hour:.1f}%/h "
             f"currency={self.currency_per_hour:.2f}/h "
             f"current_map={self.currency_current_per_hour:.2f}/h "
-            f"@ {self.timestamp.isoformat()}>"
+            f"@ {self.timestamp_dt.isoformat()}>"
         )
@@ -1,25 +1,22 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
 from typing import Any
 
+from Oracle.events.base_event import EventEnum
 from Oracle.services.events.service_event import ServiceEvent, ServiceEventType
 
 
-class WebSocketStatus(str, Enum):
+class WebSocketStatus(EventEnum):
     """WebSocket connection status."""
     CONNECTED = "connected"
     DISCONNECTED = "disconnected"
-    
-    def __str__(self) -> str:
-        return self.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class WebSocketEvent(ServiceEvent):
     """Event for WebSocket connection status changes."""
     status: WebSocketStatus
-    websocket: Any  # WebSocket instance
+    websocket: Any = None  # WebSocket instance, only on CONNECTED (a closed socket is not kept alive)
     client_info: str = ""
     type: ServiceEventType = ServiceEventType.WEBSOCKET_CONNECTED
     
@@ -31,4 +28,4 @@ class WebSocketEvent(ServiceEvent):
             self.type = ServiceEventType.WEBSOCKET_DISCONNECTED
     
     def __repr__(self) -> str:
-        return f"<WebSocketEvent status={self.status} client={self.client_info} @ {self.timestamp.isoformat()}>"
+        return f"<WebSocketEvent status={self.status} client={self.client_info} @ {self.timestamp_dt.isoformat()}>"
@@ -350,7 +350,7 @@ class MapService(ServiceBase):
                 map_name=map_info.name if map_info else None,
                 map_difficulty=map_info.difficulty if map_info else None,
                 started_at=self.map_start_time or datetime.now(),
-                completed_at=event.timestamp,
+                completed_at=event.timestamp_dt,
                 duration=event.duration,
                 currency_gained=event.currency_gained,
                 exp_gained=event.exp_gained,
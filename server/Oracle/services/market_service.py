@@ -139,7 +139,7 @@ class MarketService(ServiceBase):
             else:
                 # Check for pending transactions, if time has passed flush them
                 if self._last_event and self._total_quantity != 0:
-                    time_diff = (datetime.now() - self._last_event.timestamp).total_seconds()
+                    time_diff = (datetime.now() - self._last_event.timestamp_dt).total_seconds()
                     if time_diff > 1:
                         await self._save_transaction(
                             item_id=self._last_event.item_id,
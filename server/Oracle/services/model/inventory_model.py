@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional, Tuple
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InventoryItem:
     """Represents a single item in an inventory slot."""
     item_id: int
@@ -143,7 +143,7 @@ class Inventory:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class InventorySnapshot:
     """Snapshot of inventory state at a specific time."""
     timestamp: datetime
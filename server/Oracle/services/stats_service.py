@@ -106,7 +106,7 @@ class StatsService(ServiceBase):
         if event.map:
             logger.info(f"📊 Map details: {event.map.name} [{event.map.difficulty}]")
 
-        self._map_start = event.timestamp
+        self._map_start = event.timestamp_dt
 
         # Take the current inventory as baseline
         if not self._inventory and event.inventory:
@@ -179,7 +179,7 @@ class StatsService(ServiceBase):
         assert self._price_db is not None # should be initialized already
         
         # calculate currency gained during the map using the inventory changes
-        currency_drops = sum( self._price_db.get_price(item_id) * delta for item_id, delta in event.inventory_changes.items())
+        currency_drops = self._price_db.total_value(event.inventory_changes.items())
         
         # Calculate net currency (drops - entry cost)
         currency_gained = currency_drops - self.current_map_entry_cost
@@ -349,18 +349,18 @@ class StatsService(ServiceBase):
     def _recalculate_currency(self):
         """Recalculate all currency values from per-item quantity tracking."""
         # Farming items (gained during FightCtrl)
-        farming = sum(self._price_db.get_price(item_id) * qty for item_id, qty in self._items_total.items())
+        farming = self._price_db.total_value(self._items_total.items())
         # Entry costs (consumed items across all maps)
-        entry = sum(self._price_db.get_price(item_id) * qty for item_id, qty in self._entry_cost_items_total.items())
+        entry = self._price_db.total_value(self._entry_cost_items_total.items())
         # Market transactions
-        market = sum(self._price_db.get_price(item_id) * qty for item_id, qty in self._market_items.items())
+        market = self._price_db.total_value(self._market_items.items())
 
         self.currency_total = farming - entry + market
         self.market_currency_total = market
 
         # Current map
-        current_farming = sum(self._price_db.get_price(item_id) * qty for item_id, qty in self._current_map_items.items())
-        current_entry = sum(self._price_db.get_price(item_id) * qty for item_id, qty in self._entry_cost_items_current.items())
+        current_farming = self._price_db.total_value(self._current_map_items.items())
+        current_entry = self._price_db.total_value(self._entry_cost_items_current.items())
         self.currency_current_raw = current_farming - current_entry
         self.current_map_entry_cost = current_entry
 
@@ -545,11 +545,9 @@ class StatsService(ServiceBase):
         """Calculate total inventory value based on current prices."""
         if not self._inventory or not self._price_db:
             return 0.0
-        total = 0.0
-        for (_page, _slot), item in self._inventory.slots.items():
-            price = self._price_db.get_price(item.item_id)
-            total += price * item.quantity
-        return total
+        return self._price_db.total_value(
+            (item.item_id, item.quantity) for item in self._inventory.slots.values()
+        )
 
     async def _publish_stats(self):
         """Publish current statistics."""
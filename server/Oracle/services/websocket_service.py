@@ -3,10 +3,12 @@
 import asyncio
 import json
 import traceback
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import List, Any
 
+import orjson
 from fastapi import WebSocket
 
 from Oracle.parsing.parsers.events import ParserEvent
@@ -101,6 +103,9 @@ class WebSocketBroadcastService(ServiceBase):
         elif hasattr(value, '__dict__'):
             # Handle dataclasses and custom objects
             return self._serialize_value(value.__dict__)
+        elif is_dataclass(value):
+            # Slotted dataclasses (e.g. AffixModel) have no __dict__
+            return {f.name: self._serialize_value(getattr(value, f.name)) for f in fields(value)}
         else:
             # Fallback to string representation
             return str(value)
@@ -112,7 +117,11 @@ class WebSocketBroadcastService(ServiceBase):
     async def _broadcast_to_clients(self, data: dict):
         """Broadcast data to all connected WebSocket clients."""
         #ogger.debug(f"🕸️ Broadcasting to {len(self.clients)} client(s), event type: {data.get('type', 'unknown')}")
-        
+
+        # The payload is built once per event for all clients; with none, not at all
+        if not self.clients:
+            return
+
         # Serialize datetime objects before sending
         try:
             serialized_data = self._serialize_data(data)
@@ -121,10 +130,39 @@ class WebSocketBroadcastService(ServiceBase):
             logger.debug(f"Data: {data}")
             return
         
+        # Encode once for all clients (same compact format WebSocket.send_json writes),
+        # still sent as a text frame. Anything left unconverted is stringified, like
+        # _serialize_value's fallback. NaN/Infinity go out as null (valid JSON).
+        try:
+            try:
+                payload = orjson.dumps(serialized_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which only the stdlib encoder writes
+                payload = json.dumps(serialized_data, separators=(",", ":"), ensure_ascii=False, default=str)
+        except Exception as e:
+            logger.error(f"🕸️ Failed to encode data: {e}")
+            return
+        
+        await self._send_to_clients(payload)
+
+    async def _broadcast_parser_event(self, event: ParserEvent):
+        """Broadcast a parser event, encoded straight from its fields by to_json_bytes()."""
+        if not self.clients:
+            return
+        try:
+            payload = event.to_json_bytes().decode()
+        except orjson.JSONEncodeError:
+            # Same fallbacks as any other broadcast
+            await self._broadcast_to_clients(event.to_dict())
+            return
+        await self._send_to_clients(payload)
+
+    async def _send_to_clients(self, payload: str):
+        """Send one encoded text payload to every client, dropping dead connections."""
         dead = []
         for ws in self.clients:
             try:
-                await ws.send_json(serialized_data)
+                await ws.send_text(payload)
                 #ogger.debug(f"🕸️ ✅ Sent {serialized_data.get('type')} to {ws.client}")
             except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
                 # Network errors - client is dead
@@ -151,8 +189,9 @@ class WebSocketBroadcastService(ServiceBase):
     @event_handler(ServiceEventType.WEBSOCKET_DISCONNECTED)
     async def on_websocket_disconnected(self, event: WebSocketEvent):
         """Handle WebSocket disconnection."""
-        if event.websocket in self.clients:
-            self.clients.remove(event.websocket)
+        # The event no longer carries the closed socket; match it by its address
+        for ws in [ws for ws in self.clients if str(ws.client) == event.client_info]:
+            self.clients.remove(ws)
         logger.info(f"🕸️ Client disconnected: {event.client_info} - Total clients: {len(self.clients)}")
 
     @event_handler(ServiceEventType.MAP_STARTED)
@@ -183,13 +222,13 @@ class WebSocketBroadcastService(ServiceBase):
     async def on_player_join(self, event: PlayerJoinEvent):
         """Broadcast player join event to clients."""
         logger.debug(f"🕸️ Broadcasting PlayerJoinEvent: {event.player_name}")
-        await self._broadcast_to_clients(event.to_dict())
+        await self._broadcast_parser_event(event)
 
     @event_handler(ParserEventType.STAGE_AFFIX)
     async def on_stage_affix(self, event: StageAffixEvent):
         """Broadcast stage affix event to clients."""
         logger.debug(f"🕸️ Broadcasting StageAffixEvent: {len(event.affixes)} affixes")
-        await self._broadcast_to_clients(event.to_dict())
+        await self._broadcast_parser_event(event)
 
     @event_handler(ServiceEventType.SESSION_STARTED)
     async def on_session_started(self, event: SessionStartedEvent):